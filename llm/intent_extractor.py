@@ -1,8 +1,14 @@
+import bisect
 import datetime
+import hashlib
 import json
 import logging
+import math
 import sys
-from typing import Dict
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 from .intent_schema import *
 from dotenv import load_dotenv
 import boto3
@@ -15,13 +21,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Score cutoffs for MEDIUM (>= 0.7) and HIGH (>= 0.9); bisect_right indexes
+# straight into the matching level
+_CONFIDENCE_CUTOFFS = (0.7, 0.9)
+_CONFIDENCE_LEVELS = (ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM, ConfidenceLevel.HIGH)
+
+def _intern(value):
+    """sys.intern strings, pass anything else through for pydantic to validate"""
+    return sys.intern(value) if type(value) is str else value
+
 class IntentExtractor:
     """Fast path for simple, clear queries"""
     
-    def __init__(self, bedrock_client):
+    def __init__(
+        self,
+        bedrock_client,
+        cache_size: int = 0,
+        cache_ttl: float = 60.0,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            bedrock_client: bedrock-runtime client used for invoke_model
+            cache_size: Number of extracted intents kept per extractor (0, the
+                        default, disables the cache). Extraction runs at
+                        temperature 0, so the same query against the same model
+                        yields the same intent.
+            cache_ttl: Seconds a cached intent is reused; intents carry relative
+                       values such as time ranges, so they are not kept for long
+            timer: Clock for cache expiry
+        """
         self.bedrock = bedrock_client
         self.model_id = os.getenv('BEDROCK_MODEL_ID')
         self.regions = [os.getenv('AWS_REGION', 'us-east-1')]
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._timer = timer
+        # key -> (expiry time, intent), least recently used first
+        self._cache: OrderedDict[bytes, Tuple[float, ExtractedIntent]] = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     EXTRACTION_PROMPT = """You are an AWS multi-step query planner. Analyze the user's query and create a complete execution plan.
 
@@ -207,9 +245,48 @@ Query: "Show production instances with their attached volumes and current CPU us
 Always return json response only without any additional text, starting with {{ and ending with }}.
 """
 
+    def _cache_key(self, query: str) -> bytes:
+        """Key a query by model and query text"""
+        key = hashlib.blake2b(digest_size=16)
+        key.update(str(self.model_id).encode('utf-8'))
+        key.update(b'\0')
+        key.update(query.encode('utf-8'))
+        return key.digest()
+    
+    def _cached(self, key: bytes) -> Optional[ExtractedIntent]:
+        """Return the unexpired cached intent for key, if any"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._timer():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+    
+    def _store(self, key: bytes, intent: ExtractedIntent):
+        """Cache intent under key, evicting the least recently used entries"""
+        entry = (self._timer() + self.cache_ttl, intent)
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
     def extract(self, query: str) -> ExtractedIntent:
         """Extract intent from simple queries"""
         
+        if self.cache_size:
+            key = self._cache_key(query)
+            cached = self._cached(key)
+            if cached is not None:
+                # Hand out a copy so callers can annotate it (e.g. processing_time_ms)
+                return cached.model_copy(
+                    deep=True,
+                    update={'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat()}
+                )
+        
         prompt = self.EXTRACTION_PROMPT.format(query=query)
         
         response = self.bedrock.invoke_model(
@@ -258,8 +335,21 @@ Always return json response only without any additional text, starting with {{ a
         
         # Convert to structured intent
         intent = self._build_intent_object(query, extracted)
+        
+        if self.cache_size:
+            self._store(key, intent.model_copy(deep=True))
         return intent
     
+    def extract_batch(self, queries: List[str]) -> List[ExtractedIntent]:
+        """
+        Extract intents for several queries in order.
+        
+        With the response cache enabled, repeated queries in the batch are
+        answered from it, so each distinct query reaches the model once.
+        """
+        extract = self.extract
+        return [extract(query) for query in queries]
+    
     def _build_intent_object(self, query: str, extracted: Dict) -> ExtractedIntent:
         """Build ExtractedIntent from raw extraction"""
         
@@ -296,21 +386,23 @@ Always return json response only without any additional text, starting with {{ a
             )
             sub_intents.append(sub_intent)
         
+        # Intern the strings policies match on so comparisons hit the identity fast path
+        primary_service = _intern(extracted['primary_service'])
+        
         # Build resource
         resource = AWSResource(
-            service=extracted['primary_service'],
-            resource_type=extracted.get('resource_type'),
+            service=primary_service,
+            resource_type=_intern(extracted.get('resource_type')),
             resource_ids=extracted.get('resource_ids', []),
             filters=filters
         )
         
         # Determine confidence level
         conf_score = extracted.get('confidence', 0.0)
-        if conf_score >= 0.9:
-            confidence = ConfidenceLevel.HIGH
-        elif conf_score >= 0.7:
-            confidence = ConfidenceLevel.MEDIUM
+        if math.isfinite(conf_score):
+            confidence = _CONFIDENCE_LEVELS[bisect.bisect_right(_CONFIDENCE_CUTOFFS, conf_score)]
         else:
+            # NaN/inf would bisect to HIGH; fail closed instead
             confidence = ConfidenceLevel.LOW
         
         # Validate and normalize operation_type
@@ -337,9 +429,9 @@ Always return json response only without any additional text, starting with {{ a
             query_type=query_type,
             operation=operation,
             confidence=confidence,
-            primary_service=extracted['primary_service'],
+            primary_service=primary_service,
             primary_resource=resource,
-            action=extracted.get('action_verb', ''),
+            action=_intern(extracted.get('action_verb', '')),
             regions=regions,
             is_multi_step=is_multi_step,
             sub_intents=sub_intents,
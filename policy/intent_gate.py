@@ -1,7 +1,11 @@
 import logging
-from typing import Dict, List, Optional, Tuple
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from ..llm.intent_schema import (
     ExtractedIntent,
     OperationType,
@@ -12,6 +16,13 @@ import datetime
 from .policy_engine import PolicyEngine, PolicyEvaluationResult
 from .policy_schema import Policy, PolicyEffect, PolicyBuilder, OperationType, ConditionOperator, PolicyTemplates
 
+# Optional: single-pass protected pattern matching for IntentGate
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +35,14 @@ class GateDecision(str, Enum):
     CONFIRM = "confirm"  # Need explicit confirmation before proceeding
 
 
-@dataclass
+@dataclass(frozen=True)
 class GateResult:
-    """Result from the intent gate evaluation"""
+    """
+    Result from the intent gate evaluation
+    
+    Results may be served from the gate's evaluation cache, so treat them
+    (including their lists) as read-only.
+    """
     decision: GateDecision
     intent: ExtractedIntent
     reasoning: str
@@ -36,11 +52,104 @@ class GateResult:
     
     def __post_init__(self):
         if self.clarifying_questions is None:
-            self.clarifying_questions = []
+            object.__setattr__(self, 'clarifying_questions', [])
         if self.warnings is None:
-            self.warnings = []
+            object.__setattr__(self, 'warnings', [])
         if self.required_confirmations is None:
-            self.required_confirmations = []
+            object.__setattr__(self, 'required_confirmations', [])
+
+
+def _fingerprint(intent: ExtractedIntent) -> Tuple[Hashable, ...]:
+    """
+    Hashable key over every intent field the gate checks and policy conditions read.
+    
+    Raises TypeError if a filter value cannot be hashed.
+    """
+    resource = intent.primary_resource
+    key = (
+        intent.query_type,
+        intent.operation,
+        intent.confidence,
+        intent.primary_service,
+        intent.action,
+        tuple(intent.regions),
+        intent.limit,
+        tuple(intent.ambiguities),
+        tuple(intent.clarifying_questions),
+        resource.service,
+        resource.resource_type,
+        tuple(resource.resource_ids),
+        # Filter values are matched on str(value), so keep the type: True and 1 differ
+        tuple(
+            (f.filter_type, f.key, type(f.value),
+             tuple(f.value) if isinstance(f.value, list) else f.value, f.operator)
+            for f in resource.filters
+        ),
+    )
+    hash(key)
+    return key
+
+
+# Numeric rank of each confidence level, for threshold comparisons
+_CONFIDENCE_RANK: Dict[ConfidenceLevel, int] = {
+    ConfidenceLevel.LOW: 1,
+    ConfidenceLevel.MEDIUM: 2,
+    ConfidenceLevel.HIGH: 3
+}
+
+
+# Responses to a CONFIRM result. Phrases match anywhere in the response and
+# confirmation wins over rejection ("yes, stop them" confirms).
+_CONFIRMATION_PHRASES = ('confirm', 'yes', 'proceed', 'continue', 'go ahead')
+_REJECTION_PHRASES = ('no', 'cancel', 'abort', 'stop', 'nevermind')
+_CONFIRM_RE = re.compile('|'.join(map(re.escape, _CONFIRMATION_PHRASES)))
+_REJECT_RE = re.compile('|'.join(map(re.escape, _REJECTION_PHRASES)))
+# Bare phrases, the usual reply, resolve without a scan
+_EXACT_RESPONSES = {
+    **{phrase: "reject" for phrase in _REJECTION_PHRASES},
+    **{phrase: "confirm" for phrase in _CONFIRMATION_PHRASES},
+}
+
+
+def _classify_confirmation(user_lower: str) -> str:
+    """Classify a lowered, stripped confirmation response as confirm, reject or unclear"""
+    kind = _EXACT_RESPONSES.get(user_lower)
+    if kind is not None:
+        return kind
+    if _CONFIRM_RE.search(user_lower):
+        return "confirm"
+    if _REJECT_RE.search(user_lower):
+        return "reject"
+    return "unclear"
+
+
+class _Transition(NamedTuple):
+    """How a pending CONFIRM result changes for one kind of response"""
+    decision: GateDecision
+    reasoning: str
+    log_message: Optional[str]
+    keep_warnings: bool
+    required_confirmations: Tuple[str, ...]
+
+
+_CONFIRMATION_TRANSITIONS: Dict[str, _Transition] = {
+    "confirm": _Transition(
+        GateDecision.PROCEED, "User explicitly confirmed the operation",
+        "User confirmed high-risk operation", True, ()
+    ),
+    "reject": _Transition(
+        GateDecision.REJECT, "User declined to confirm the operation",
+        "User rejected high-risk operation", False, ()
+    ),
+    # Ambiguous response, ask again
+    "unclear": _Transition(
+        GateDecision.CONFIRM, "Confirmation response not clear",
+        None, True, ("Please respond with 'confirm' to proceed or 'cancel' to abort.",)
+    ),
+}
+
+
+DEFAULT_POLICY_VERSION = 1
 
 
 class IntentGate:
@@ -50,11 +159,16 @@ class IntentGate:
     The gate applies multiple validation layers:
     1. Confidence checks
     2. Completeness validation
-    3. Safety checks
+    3. Ambiguity resolution
     4. Resource constraints
-    5. Ambiguity resolution
+    5. Policy evaluation
+    6. Safety checks
     """
     
+    # Default policy sets, built once per DEFAULT_POLICY_VERSION; gates
+    # constructed without explicit policies get copies
+    _DEFAULT_POLICIES: Dict[int, Tuple[Policy, ...]] = {}
+    
     def __init__(self, config: Optional[Dict] = None, policies: Optional[List[Policy]] = None, enable_policies: bool = True):
         """
         Initialize the intent gate with optional configuration.
@@ -66,6 +180,12 @@ class IntentGate:
         """
         self.config = config or {}
         
+        # LRU of results keyed by gate settings, policy generations and intent
+        # fingerprint; off unless evaluation_cache_size is configured
+        self.evaluation_cache_size = self.config.get('evaluation_cache_size', 0)
+        self._evaluation_cache: OrderedDict[Tuple[Hashable, ...], GateResult] = OrderedDict()
+        self._evaluation_lock = threading.Lock()
+        
         # Confidence thresholds
         self.min_confidence_proceed = self.config.get('min_confidence_proceed', ConfidenceLevel.MEDIUM)
         self.min_confidence_write = self.config.get('min_confidence_write', ConfidenceLevel.HIGH)
@@ -86,56 +206,183 @@ class IntentGate:
             OperationType.WRITE: ['stop', 'restart', 'reboot', 'modify']
         }
         
-        default_policy = [
-            PolicyTemplates.deny_production_modifications(),
-            PolicyBuilder("default-policies")
-            .statement("allow-reads")
-            .allow()
-            .read_operations()
-            .all_resources()
-            .end_statement()
-            .statement("approval-for-writes")
-            .require_approval()
-            .write_operations()
-            .all_resources()
-            .end_statement()
-            .statement('deny-delete')
-            .deny()
-            .delete_operations()
-            .all_resources()
-            .end_statement()
-            .build()
-        ]
-        
         self.enable_policies = enable_policies
-        self.policy_engine = PolicyEngine(policies if policies is not None else default_policy)
-        
+        self.policy_engine = PolicyEngine(policies if policies is not None else self._default_policies())
+        
+    @classmethod
+    def _default_policies(cls) -> List[Policy]:
+        """Return copies of the default policy set"""
+        policies = cls._DEFAULT_POLICIES.get(DEFAULT_POLICY_VERSION)
+        if policies is None:
+            policies = cls._DEFAULT_POLICIES.setdefault(DEFAULT_POLICY_VERSION, (
+                PolicyTemplates.deny_production_modifications(),
+                PolicyBuilder("default-policies")
+                .statement("allow-reads")
+                .allow()
+                .read_operations()
+                .all_resources()
+                .end_statement()
+                .statement("approval-for-writes")
+                .require_approval()
+                .write_operations()
+                .all_resources()
+                .end_statement()
+                .statement('deny-delete')
+                .deny()
+                .delete_operations()
+                .all_resources()
+                .end_statement()
+                .build()
+            ))
+        # Each engine gets its own list and policies so add_policy/remove_policy
+        # and add_statement stay local
+        return [policy.copy() for policy in policies]
+    
     def add_policy(self, policy: Policy):
         """Add a policy to the engine"""
         self.policy_engine.add_policy(policy)
+        self.clear_evaluation_cache()
     
     def remove_policy(self, policy_name: str) -> bool:
         """Remove a policy by name"""
-        return self.policy_engine.remove_policy(policy_name)
+        removed = self.policy_engine.remove_policy(policy_name)
+        self.clear_evaluation_cache()
+        return removed
+    
+    @property
+    def protected_patterns(self) -> Tuple[str, ...]:
+        """Resource name patterns that require explicit confirmation"""
+        return self._protected_patterns
+    
+    @protected_patterns.setter
+    def protected_patterns(self, patterns: Sequence[str]):
+        # Stored as a tuple so the matchers below can't drift from it in place
+        self._protected_patterns = tuple(patterns)
+        self._protected_pairs = tuple((pattern, pattern.lower()) for pattern in self._protected_patterns)
+        self._protected_automaton = self._build_protected_automaton()
+        self.clear_evaluation_cache()
+    
+    def clear_evaluation_cache(self):
+        """Drop cached results (changed settings or policies already stop them being reused)"""
+        with self._evaluation_lock:
+            self._evaluation_cache.clear()
     
     def evaluate(self, intent: ExtractedIntent) -> GateResult:
         """
         Main evaluation method that runs all gate checks.
         
+        Intents that agree on every field the gate reads get the same decision,
+        so with evaluation_cache_size set, results are cached by intent fingerprint
+        (and the current settings and policies) and re-issued for the new intent.
+        
         Args:
             intent: The extracted intent to evaluate
             
         Returns:
             GateResult with decision and supporting information
         """
+        if not self.evaluation_cache_size:
+            return self._evaluate(intent)
+        try:
+            key = (self._settings_key(), _fingerprint(intent))
+        except TypeError:
+            return self._evaluate(intent)
+        return self._evaluate_cached(intent, key)
+    
+    def evaluate_many(self, intents: Sequence[ExtractedIntent]) -> List[GateResult]:
+        """
+        Evaluate several intents, returning results in the same order.
+        
+        Each distinct intent fingerprint is evaluated once per call (even with the
+        evaluation cache disabled); repeats get that result re-issued for their intent.
+        """
+        results = []
+        seen: Dict[Tuple[Hashable, ...], GateResult] = {}
+        settings = None
+        if self.evaluation_cache_size:
+            try:
+                settings = self._settings_key()
+            except TypeError:
+                pass
+        for intent in intents:
+            try:
+                key = _fingerprint(intent)
+            except TypeError:
+                results.append(self._evaluate(intent))
+                continue
+            result = seen.get(key)
+            if result is None:
+                result = seen[key] = (
+                    self._evaluate_cached(intent, (settings, key)) if settings is not None
+                    else self._evaluate(intent)
+                )
+            elif result.intent is not intent:
+                result = replace(result, intent=intent)
+            results.append(result)
+        return results
+    
+    def _settings_key(self) -> Tuple[Hashable, ...]:
+        """
+        Hashable key over the gate settings and policy state a result depends on,
+        so cached results are not reused after either changes
+        
+        Raises TypeError if a setting cannot be hashed.
+        """
+        engine = self.policy_engine
+        key = (
+            self.min_confidence_proceed,
+            self.min_confidence_write,
+            self.require_confirmation_for_delete,
+            self.require_confirmation_for_write,
+            self.max_resource_limit,
+            self._protected_patterns,
+            tuple((operation, tuple(actions)) for operation, actions in self.high_risk_operations.items()),
+            self.enable_policies,
+            engine.short_circuit,
+            tuple(policy.generation for policy in engine.policies),
+        )
+        hash(key)
+        return key
+    
+    def _evaluate_cached(self, intent: ExtractedIntent, key: Tuple[Hashable, ...]) -> GateResult:
+        """
+        Serve an intent from the evaluation cache, evaluating and storing it on a miss.
+        
+        The lock covers only the cache bookkeeping; concurrent misses on the same
+        key may both evaluate, and the last one stored wins.
+        """
+        cache = self._evaluation_cache
+        with self._evaluation_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+        if cached is not None:
+            logger.info(f"Gate decision: {cached.decision.value} (cached) - {cached.reasoning}")
+            return cached if cached.intent is intent else replace(cached, intent=intent)
+        
+        result = self._evaluate(intent)
+        with self._evaluation_lock:
+            cache[key] = result
+            while len(cache) > self.evaluation_cache_size:
+                cache.popitem(last=False)
+        return result
+    
+    def _evaluate(self, intent: ExtractedIntent) -> GateResult:
+        """Run all gate checks for an intent (uncached)"""
         logger.info(f"🚦 Evaluating intent: {intent.operation.value} on {intent.primary_service}")
         
-        # Run validation checks in order
+        # Run validation checks in order. These are cheap and any of them
+        # settles the decision, so they run before the policy engine. The order
+        # also sets precedence when several apply: an error intent rejects, then
+        # the confidence, completeness and ambiguity CLARIFY checks, then the
+        # resource limit REJECT, which wins over the missing-region CLARIFY.
         basic_checks = [
             self._check_error_intent,
             self._check_confidence,
             self._check_completeness,
             self._check_ambiguities,
+            self._check_resource_constraints,
+            self._check_region,
         ]
         
         for check in basic_checks:
@@ -163,13 +410,6 @@ class IntentGate:
         # Step 3: Run safety checks (may add confirmations)
         safety_result = self._check_safety(intent)
         
-        # Step 4: Run resource constraint checks
-        constraint_result = self._check_resource_constraints(intent)
-        
-        if constraint_result:
-            logger.info(f"Gate decision: {constraint_result.decision.value} - {constraint_result.reasoning}")
-            return constraint_result
-        
         # Combine gate result with policy result
         return self._combine_results(safety_result, policy_result, intent)
             
@@ -180,7 +420,8 @@ class IntentGate:
                 decision=GateDecision.REJECT,
                 intent=intent,
                 reasoning="Intent extraction failed",
-                clarifying_questions=intent.clarifying_questions or [
+                # Copied so the result (which may be cached) doesn't share the intent's list
+                clarifying_questions=list(intent.clarifying_questions) or [
                     "I couldn't understand your query. Could you rephrase it?",
                     "Try something like: 'list my EC2 instances' or 'show S3 buckets'"
                 ]
@@ -238,6 +479,20 @@ class IntentGate:
         
         return None
     
+    def _check_region(self, intent: ExtractedIntent) -> Optional[GateResult]:
+        """Check that write/delete operations name an explicit region"""
+        if not intent.regions and intent.operation in [OperationType.WRITE, OperationType.DELETE]:
+            return GateResult(
+                decision=GateDecision.CLARIFY,
+                intent=intent,
+                reasoning="Region must be specified for write/delete operations",
+                clarifying_questions=[
+                    "Which AWS region should I target for this operation?",
+                    "For safety, write and delete operations require explicit region specification."
+                ]
+            )
+        return None
+    
     def _check_ambiguities(self, intent: ExtractedIntent) -> Optional[GateResult]:
         """Check for ambiguities that need clarification"""
         if intent.ambiguities:
@@ -333,47 +588,56 @@ class IntentGate:
                     ]
                 )
         
-        # Check for region constraints
-        if not intent.regions and intent.operation in [OperationType.WRITE, OperationType.DELETE]:
-            return GateResult(
-                decision=GateDecision.CLARIFY,
-                intent=intent,
-                reasoning="Region must be specified for write/delete operations",
-                clarifying_questions=[
-                    "Which AWS region should I target for this operation?",
-                    "For safety, write and delete operations require explicit region specification."
-                ]
-            )
-        
         return None
     
+    def _build_protected_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the lowered protected patterns, or
+        None to use plain substring checks (pyahocorasick missing, no patterns,
+        or an empty pattern, which matches everything)
+        """
+        if not AHOCORASICK_AVAILABLE or not self._protected_pairs:
+            return None
+        originals: Dict[str, List[str]] = {}
+        for pattern, lowered in self._protected_pairs:
+            if not lowered:
+                return None
+            originals.setdefault(lowered, []).append(pattern)
+        automaton = ahocorasick.Automaton()
+        for lowered, patterns in originals.items():
+            automaton.add_word(lowered, tuple(patterns))
+        automaton.make_automaton()
+        return automaton
+    
+    def _match_protected(self, text: str, protected: List[str]):
+        """Append the protected patterns occurring in lowered text to protected"""
+        automaton = self._protected_automaton
+        if automaton is not None:
+            for _, patterns in automaton.iter(text):
+                protected.extend(patterns)
+        else:
+            for pattern, lowered in self._protected_pairs:
+                if lowered in text:
+                    protected.append(pattern)
+    
     def _check_protected_resources(self, intent: ExtractedIntent) -> List[str]:
         """Check if intent targets protected resources"""
         protected = []
         
         # Check resource IDs
         for resource_id in intent.primary_resource.resource_ids:
-            for pattern in self.protected_patterns:
-                if pattern.lower() in resource_id.lower():
-                    protected.append(pattern)
+            self._match_protected(resource_id.lower(), protected)
         
         # Check filters
         for filter_item in intent.primary_resource.filters:
             if filter_item.filter_type in ['name', 'tag']:
-                for pattern in self.protected_patterns:
-                    if pattern.lower() in str(filter_item.value).lower():
-                        protected.append(pattern)
+                self._match_protected(str(filter_item.value).lower(), protected)
         
         return list(set(protected))  # Remove duplicates
     
     def _confidence_level_value(self, level: ConfidenceLevel) -> int:
         """Convert confidence level to numeric value for comparison"""
-        mapping = {
-            ConfidenceLevel.LOW: 1,
-            ConfidenceLevel.MEDIUM: 2,
-            ConfidenceLevel.HIGH: 3
-        }
-        return mapping.get(level, 0)
+        return _CONFIDENCE_RANK.get(level, 0)
     
     def _combine_results(
         self,
@@ -399,19 +663,20 @@ class IntentGate:
             confirmations.extend(gate_result.required_confirmations or [])
             warnings.extend(gate_result.warnings or [])
         
-        # Policy explicitly denies
-        if policy_result and policy_result.effect == PolicyEffect.DENY:
-            return GateResult(
-                decision=GateDecision.REJECT,
-                intent=intent,
-                reasoning=f"Policy denied: {policy_result.reasoning}",
-                warnings=warnings
-            )
-        
-        # Policy requires approval
-        if policy_result and policy_result.effect == PolicyEffect.REQUIRE_APPROVAL:
-            # Merge with existing confirmations if gate already required confirm
-            confirmations.append(f"🔐 Policy requires approval: {policy_result.reasoning}")
+        match policy_result:
+            # Policy explicitly denies
+            case PolicyEvaluationResult(effect=PolicyEffect.DENY):
+                return GateResult(
+                    decision=GateDecision.REJECT,
+                    intent=intent,
+                    reasoning=f"Policy denied: {policy_result.reasoning}",
+                    warnings=warnings
+                )
+            
+            # Policy requires approval
+            case PolicyEvaluationResult(effect=PolicyEffect.REQUIRE_APPROVAL):
+                # Merge with existing confirmations if gate already required confirm
+                confirmations.append(f"🔐 Policy requires approval: {policy_result.reasoning}")
         
         # Determine final decision
         if confirmations:
@@ -445,48 +710,104 @@ class IntentGate:
         if gate_result.decision != GateDecision.CONFIRM:
             return gate_result
         
-        # Check for explicit confirmation
-        confirmation_phrases = ['confirm', 'yes', 'proceed', 'continue', 'go ahead']
-        rejection_phrases = ['no', 'cancel', 'abort', 'stop', 'nevermind']
-        
+        # Classify the response, then apply that transition to the pending result
         user_lower = user_response.lower().strip()
-        
-        if any(phrase in user_lower for phrase in confirmation_phrases):
-            logger.info("User confirmed high-risk operation")
-            return GateResult(
-                decision=GateDecision.PROCEED,
-                intent=gate_result.intent,
-                reasoning="User explicitly confirmed the operation",
-                warnings=gate_result.warnings
-            )
-        elif any(phrase in user_lower for phrase in rejection_phrases):
-            logger.info("User rejected high-risk operation")
-            return GateResult(
-                decision=GateDecision.REJECT,
-                intent=gate_result.intent,
-                reasoning="User declined to confirm the operation"
-            )
-        else:
-            # Ambiguous response, ask again
-            return GateResult(
-                decision=GateDecision.CONFIRM,
-                intent=gate_result.intent,
-                reasoning="Confirmation response not clear",
-                required_confirmations=[
-                    "Please respond with 'confirm' to proceed or 'cancel' to abort."
-                ],
-                warnings=gate_result.warnings
-            )
+        transition = _CONFIRMATION_TRANSITIONS[_classify_confirmation(user_lower)]
+        if transition.log_message:
+            logger.info(transition.log_message)
+        return replace(
+            gate_result,
+            decision=transition.decision,
+            reasoning=transition.reasoning,
+            clarifying_questions=[],
+            required_confirmations=list(transition.required_confirmations),
+            warnings=gate_result.warnings if transition.keep_warnings else []
+        )
+
+
+class _TTLCache:
+    """
+    Bounded mapping whose entries expire ttl seconds after they were last set.
+    
+    Setting a key beyond maxsize evicts the least recently set entry. Safe to
+    share between threads.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        # key -> (expiry time, value), oldest set first; with one ttl for every
+        # entry that is also expiry order
+        self._data: OrderedDict[str, Tuple[float, GateResult]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _expire(self):
+        """Drop expired entries from the front (call with the lock held)"""
+        data = self._data
+        now = self._timer()
+        while data:
+            key, (expires_at, _) = next(iter(data.items()))
+            if expires_at > now:
+                break
+            del data[key]
+    
+    def __setitem__(self, key: str, value: GateResult):
+        with self._lock:
+            self._expire()
+            self._data[key] = (self._timer() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def __getitem__(self, key: str) -> GateResult:
+        with self._lock:
+            self._expire()
+            return self._data[key][1]
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            self._expire()
+            return key in self._data
+    
+    def __delitem__(self, key: str):
+        with self._lock:
+            del self._data[key]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._data)
+    
+    def get(self, key: str, default: Optional[GateResult] = None) -> Optional[GateResult]:
+        with self._lock:
+            self._expire()
+            entry = self._data.get(key)
+            return default if entry is None else entry[1]
+    
+    def pop(self, key: str, default: Optional[GateResult] = None) -> Optional[GateResult]:
+        with self._lock:
+            self._expire()
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
 
 
 class IntentGateWithHistory:
     """
     Intent gate with conversation history tracking for multi-turn clarifications.
+    
+    Pending clarifications are kept for config 'conv_ttl_sec' seconds (default 600)
+    after they were last updated, and at most config 'conv_cache_size' (default
+    10000) conversations are tracked, so abandoned conversations don't accumulate.
     """
     
     def __init__(self, config: Optional[Dict] = None, policies: Optional[List[Policy]] = None, enable_policies: bool = True):
         self.gate = IntentGate(config)
-        self.pending_clarifications: Dict[str, GateResult] = {}
+        config = config or {}
+        self.pending_clarifications = _TTLCache(
+            maxsize=config.get('conv_cache_size', 10000),
+            ttl=config.get('conv_ttl_sec', 600)
+        )
         
     def add_policy(self, policy: Policy):
         """Add a policy to the engine"""
@@ -532,18 +853,17 @@ class IntentGateWithHistory:
         Returns:
             Updated GateResult or None if no pending clarification
         """
-        if conversation_id not in self.pending_clarifications:
+        previous_result = self.pending_clarifications.get(conversation_id)
+        if previous_result is None:
             return None
         
-        previous_result = self.pending_clarifications[conversation_id]
-        
         # If we have a confirmation pending
         if previous_result.decision == GateDecision.CONFIRM:
             result = self.gate.process_confirmation(previous_result, user_response)
             
             if result.decision != GateDecision.CONFIRM:
                 # Confirmation resolved, remove from pending
-                del self.pending_clarifications[conversation_id]
+                self.pending_clarifications.pop(conversation_id)
             else:
                 # Still need confirmation, update pending
                 self.pending_clarifications[conversation_id] = result
@@ -560,8 +880,7 @@ class IntentGateWithHistory:
     
     def clear_pending(self, conversation_id: str):
         """Clear pending clarifications for a conversation"""
-        if conversation_id in self.pending_clarifications:
-            del self.pending_clarifications[conversation_id]
+        self.pending_clarifications.pop(conversation_id)
 
 
 if __name__ == "__main__":
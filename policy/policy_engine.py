@@ -7,7 +7,7 @@ if operations should be allowed, denied, or require additional approval.
 
 import re
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 from dataclasses import dataclass
 from ..llm.intent_schema import ExtractedIntent, OperationType, AWSResource, ResourceFilter
 from .policy_schema import (
@@ -16,12 +16,30 @@ from .policy_schema import (
     PolicyEffect,
     ResourcePattern,
     PolicyCondition,
-    ConditionOperator
+    ConditionOperator,
+    _OpCode
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Scalar operator dispatch, indexed by PolicyCondition._code: actual is the
+# lowercased intent value, expected is the condition value normalised for the
+# operator - the precomputed lookup set for IN/NOT_IN, the compiled pattern for
+# MATCHES (see PolicyCondition)
+_OP_TABLE: Tuple[Callable[[str, Any], bool], ...] = (
+    lambda a, e: a == e,            # EQUALS
+    lambda a, e: a != e,            # NOT_EQUALS
+    lambda a, e: a in e,            # IN
+    lambda a, e: a not in e,        # NOT_IN
+    lambda a, e: a.startswith(e),   # STARTS_WITH
+    lambda a, e: a.endswith(e),     # ENDS_WITH
+    lambda a, e: e in a,            # CONTAINS
+    lambda a, e: e not in a,        # NOT_CONTAINS
+    lambda a, e: bool(e.match(a)),  # MATCHES
+)
+
+
 @dataclass
 class PolicyEvaluationResult:
     """Result of policy evaluation"""
@@ -49,14 +67,17 @@ class PolicyEngine:
     3. Default: ALLOW if no matching statements
     """
     
-    def __init__(self, policies: Optional[List[Policy]] = None):
+    def __init__(self, policies: Optional[List[Policy]] = None, short_circuit: bool = False):
         """
         Initialize policy engine with policies
         
         Args:
             policies: List of policies to enforce (empty list means allow all)
+            short_circuit: Default evaluate() to fast_evaluate(), which keeps only
+                           the first matching statement per effect
         """
         self.policies = policies or []
+        self.short_circuit = short_circuit
     
     def add_policy(self, policy: Policy):
         """Add a policy to the engine"""
@@ -72,16 +93,23 @@ class PolicyEngine:
             logger.info(f"Removed policy: {policy_name}")
         return removed
     
-    def evaluate(self, intent: ExtractedIntent) -> PolicyEvaluationResult:
+    def evaluate(self, intent: ExtractedIntent, detailed: Optional[bool] = None) -> PolicyEvaluationResult:
         """
         Evaluate an intent against all configured policies
         
         Args:
             intent: The extracted intent to evaluate
+            detailed: Collect every matching statement (audit trail). When False,
+                      delegates to fast_evaluate(). Defaults to not short_circuit.
             
         Returns:
             PolicyEvaluationResult with final decision
         """
+        if detailed is None:
+            detailed = not self.short_circuit
+        if not detailed:
+            return self.fast_evaluate(intent)
+        
         logger.info(f"🔍 Evaluating intent against {len(self.policies)} policies")
         
         # If no policies configured, allow by default
@@ -97,17 +125,24 @@ class PolicyEngine:
         allow_statements = []
         approval_statements = []
         
+        buckets = (
+            (PolicyEffect.DENY, deny_statements),
+            (PolicyEffect.ALLOW, allow_statements),
+            (PolicyEffect.REQUIRE_APPROVAL, approval_statements)
+        )
+        
+        # Only walk statements that apply to the intent's operation and resource;
+        # resolved ones match without further checks
+        operation = intent.operation
+        resource = intent.primary_resource
         for policy in self.policies:
-            for statement in policy.statements:
-                if self._statement_matches_intent(statement, intent):
-                    logger.debug(f"Statement matched: {statement.sid} ({statement.effect.value})")
-                    
-                    if statement.effect == PolicyEffect.DENY:
-                        deny_statements.append(statement)
-                    elif statement.effect == PolicyEffect.ALLOW:
-                        allow_statements.append(statement)
-                    elif statement.effect == PolicyEffect.REQUIRE_APPROVAL:
-                        approval_statements.append(statement)
+            for effect, matched in buckets:
+                for statement, resolved in policy.candidates_for(
+                    effect, operation, resource.service, resource.resource_type
+                ):
+                    if resolved or self._statement_matches_intent(statement, intent):
+                        logger.debug(f"Statement matched: {statement.sid} ({statement.effect.value})")
+                        matched.append(statement)
         
         # Apply precedence: DENY > ALLOW > REQUIRE_APPROVAL
         
@@ -152,6 +187,76 @@ class PolicyEngine:
             reasoning="No matching policy statements found - denying by default for security"
         )
     
+    def fast_evaluate(self, intent: ExtractedIntent) -> PolicyEvaluationResult:
+        """
+        Evaluate an intent keeping only the first matching statement per effect
+        
+        Reaches the same decision as the detailed evaluation, but walks the
+        (effect, operation) buckets in precedence order and stops at the first
+        match, building reasoning from a single statement. Meant for runtime
+        enforcement.
+        
+        Args:
+            intent: The extracted intent to evaluate
+            
+        Returns:
+            PolicyEvaluationResult with at most one matched statement
+        """
+        if not self.policies:
+            return PolicyEvaluationResult(
+                effect=PolicyEffect.ALLOW,
+                matched_statements=[],
+                reasoning="No policies configured - allowing by default"
+            )
+        
+        # DENY has the highest precedence - nothing else can change the outcome
+        statement = self._first_match(PolicyEffect.DENY, intent)
+        if statement is not None:
+            return PolicyEvaluationResult(
+                effect=PolicyEffect.DENY,
+                matched_statements=[statement],
+                reasoning=self._build_deny_reasoning([statement])
+            )
+        
+        # Approval requirements are honored whether or not an ALLOW matched
+        statement = self._first_match(PolicyEffect.REQUIRE_APPROVAL, intent)
+        if statement is not None:
+            return PolicyEvaluationResult(
+                effect=PolicyEffect.REQUIRE_APPROVAL,
+                matched_statements=[statement],
+                reasoning=self._build_approval_reasoning([statement]),
+                requires_approval=True
+            )
+        
+        statement = self._first_match(PolicyEffect.ALLOW, intent)
+        if statement is not None:
+            return PolicyEvaluationResult(
+                effect=PolicyEffect.ALLOW,
+                matched_statements=[statement],
+                reasoning=self._build_allow_reasoning([statement])
+            )
+        
+        return PolicyEvaluationResult(
+            effect=PolicyEffect.DENY,
+            matched_statements=[],
+            reasoning="No matching policy statements found - denying by default for security"
+        )
+    
+    def _first_match(
+        self,
+        effect: PolicyEffect,
+        intent: ExtractedIntent
+    ) -> Optional[PolicyStatement]:
+        """Return the first statement with the given effect that matches the intent"""
+        resource = intent.primary_resource
+        for policy in self.policies:
+            for statement, resolved in policy.candidates_for(
+                effect, intent.operation, resource.service, resource.resource_type
+            ):
+                if resolved or self._statement_matches_intent(statement, intent):
+                    return statement
+        return None
+    
     def _statement_matches_intent(
         self,
         statement: PolicyStatement,
@@ -166,12 +271,14 @@ class PolicyEngine:
         3. All conditions match
         """
         # 1. Check operation match
-        if intent.operation not in statement.operations:
+        if not statement.applies_to(intent.operation):
             return False
         
-        # 2. Check resource match
-        if not any(self._resource_matches(pattern, intent.primary_resource) 
-                   for pattern in statement.resources):
+        # 2. Check resource match (indexed patterns first, then ID patterns)
+        resource = intent.primary_resource
+        if not (statement.matches(resource.service, resource.resource_type) or
+                any(self._resource_matches(pattern, resource)
+                    for pattern in statement._id_patterns)):
             return False
         
         # 3. Check all conditions
@@ -188,6 +295,9 @@ class PolicyEngine:
     ) -> bool:
         """Check if a resource pattern matches an AWS resource"""
         
+        if pattern.matches_all():
+            return True
+        
         # Check service match
         if pattern.service and pattern.service != "*":
             if pattern.service != resource.service:
@@ -245,11 +355,7 @@ class PolicyEngine:
             ]
         
         # Evaluate based on operator
-        return self._evaluate_condition_operator(
-            condition.operator,
-            actual_value,
-            condition.value
-        )
+        return self._evaluate_condition_operator(condition, actual_value)
     
     def _extract_condition_value(
         self,
@@ -295,58 +401,39 @@ class PolicyEngine:
     
     def _evaluate_condition_operator(
         self,
-        operator: ConditionOperator,
-        actual: any,
-        expected: any
+        condition: PolicyCondition,
+        actual: any
     ) -> bool:
         """Evaluate a condition operator"""
+        code = condition._code
+        if code is None:
+            return False
         
         # Handle list values (e.g., regions, resource_ids)
         if isinstance(actual, list):
             # For list comparisons, check if ANY item matches
-            if operator == ConditionOperator.IN:
-                return any(item in expected for item in actual)
-            elif operator == ConditionOperator.NOT_IN:
-                return all(item not in expected for item in actual)
+            if code == _OpCode.IN:
+                return any(item in condition.value for item in actual)
+            elif code == _OpCode.NOT_IN:
+                return all(item not in condition.value for item in actual)
             else:
                 # For other operators, check if ANY item matches
                 return any(
-                    self._evaluate_condition_operator(operator, item, expected)
+                    self._evaluate_condition_operator(condition, item)
                     for item in actual
                 )
         
         # String comparisons
         actual_str = str(actual).lower()
-        expected_str = str(expected).lower() if isinstance(expected, str) else expected
-        
-        if operator == ConditionOperator.EQUALS:
-            return actual_str == expected_str
-        
-        elif operator == ConditionOperator.NOT_EQUALS:
-            return actual_str != expected_str
-        
-        elif operator == ConditionOperator.IN:
-            return actual_str in [str(v).lower() for v in expected]
-        
-        elif operator == ConditionOperator.NOT_IN:
-            return actual_str not in [str(v).lower() for v in expected]
-        
-        elif operator == ConditionOperator.STARTS_WITH:
-            return actual_str.startswith(expected_str)
-        
-        elif operator == ConditionOperator.ENDS_WITH:
-            return actual_str.endswith(expected_str)
-        
-        elif operator == ConditionOperator.CONTAINS:
-            return expected_str in actual_str
-        
-        elif operator == ConditionOperator.NOT_CONTAINS:
-            return expected_str not in actual_str
-        
-        elif operator == ConditionOperator.MATCHES:
-            return bool(re.match(expected_str, actual_str))
-        
-        return False
+        if code == _OpCode.IN or code == _OpCode.NOT_IN:
+            expected_norm = condition._value_set
+        elif code == _OpCode.MATCHES:
+            expected_norm = condition._compiled
+        else:
+            expected = condition.value
+            expected_norm = str(expected).lower() if isinstance(expected, str) else expected
+        
+        return _OP_TABLE[code](actual_str, expected_norm)
     
     def _build_deny_reasoning(self, statements: List[PolicyStatement]) -> str:
         """Build reasoning message for deny decision"""
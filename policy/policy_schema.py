@@ -4,11 +4,24 @@ Policy Schema for Intent Gate Policy Engine
 Provides flexible, IAM-like policies for controlling AWS operations
 """
 
-from enum import Enum
-from typing import List, Optional, Dict, Any, Union
+import functools
+import itertools
+import json
+import re
+import sys
+import threading
+from enum import Enum, IntEnum, IntFlag
+from typing import List, Optional, Dict, Any, Union, FrozenSet, Iterator, Pattern, Sequence, Tuple
 from dataclasses import dataclass, field
 from ..llm.intent_schema import OperationType
 
+# Optional: faster JSON encoding for Policy.to_json_bytes()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class PolicyEffect(str, Enum):
     """Effect of a policy statement"""
@@ -17,6 +30,24 @@ class PolicyEffect(str, Enum):
     REQUIRE_APPROVAL = "require_approval"  # Forces confirmation even for reads
 
 
+class OperationMask(IntFlag):
+    """Bitmask over OperationType (one bit per member name)"""
+    NONE = 0
+    READ = 1
+    WRITE = 2
+    DELETE = 4
+    ANALYZE = 8
+    ALL = READ | WRITE | DELETE | ANALYZE
+    
+    @classmethod
+    def of(cls, operations) -> 'OperationMask':
+        """Fold operation types (or their string values) into a mask"""
+        mask = cls.NONE
+        for op in operations:
+            mask |= cls[OperationType(op).name]
+        return mask
+
+
 class ConditionOperator(str, Enum):
     """Operators for condition matching"""
     EQUALS = "equals"
@@ -30,69 +61,202 @@ class ConditionOperator(str, Enum):
     MATCHES = "matches"  # Regex match
 
 
-@dataclass
+class _OpCode(IntEnum):
+    """Integer codes for ConditionOperator (index into the engine's dispatch table)"""
+    EQUALS = 0
+    NOT_EQUALS = 1
+    IN = 2
+    NOT_IN = 3
+    STARTS_WITH = 4
+    ENDS_WITH = 5
+    CONTAINS = 6
+    NOT_CONTAINS = 7
+    MATCHES = 8
+
+
+_OPCODES: Dict[ConditionOperator, _OpCode] = {op: _OpCode[op.name] for op in ConditionOperator}
+
+
+@dataclass(frozen=True, slots=True)
 class PolicyCondition:
     """Condition for policy evaluation"""
     key: str  # e.g., "region", "tag:Environment", "resource_id"
     operator: ConditionOperator
     value: Union[str, List[str]]
+    # Derived from value in __post_init__
+    _compiled: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _value_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _code: Optional[_OpCode] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        object.__setattr__(self, '_code', _OPCODES.get(self.operator))
+        
         # Convert single value to list for IN/NOT_IN operators
         if self.operator in [ConditionOperator.IN, ConditionOperator.NOT_IN]:
             if not isinstance(self.value, list):
-                self.value = [self.value]
+                object.__setattr__(self, 'value', [self.value])
+            # Lowercased lookup set for O(1) membership checks
+            object.__setattr__(self, '_value_set', frozenset(str(v).lower() for v in self.value))
+        
+        # Compile the pattern once instead of on every evaluation
+        elif self.operator == ConditionOperator.MATCHES:
+            object.__setattr__(self, '_compiled', re.compile(
+                self.value.lower() if isinstance(self.value, str) else self.value
+            ))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourcePattern:
-    """Pattern for matching AWS resources"""
+    """
+    Pattern for matching AWS resources
+    
+    Immutable, so the builder can hand out shared instances for the common
+    wildcard and per-service patterns.
+    """
     service: Optional[str] = None  # e.g., "ec2", "*"
     resource_type: Optional[str] = None  # e.g., "instance", "*"
-    resource_ids: List[str] = field(default_factory=list)  # Specific IDs or patterns
+    resource_ids: Tuple[str, ...] = ()  # Specific IDs or patterns
+    _matches_all: bool = field(default=False, init=False, repr=False, compare=False)
     
-    def matches_all(self) -> bool:
-        """Check if this pattern matches all resources"""
-        return (
+    def __post_init__(self):
+        """Freeze resource IDs, intern the matched strings and precompute the match-all flag"""
+        object.__setattr__(self, 'resource_ids', tuple(self.resource_ids or ()))
+        if type(self.service) is str:
+            object.__setattr__(self, 'service', sys.intern(self.service))
+        if type(self.resource_type) is str:
+            object.__setattr__(self, 'resource_type', sys.intern(self.resource_type))
+        object.__setattr__(self, '_matches_all', (
             (self.service == "*" or self.service is None) and
             (self.resource_type == "*" or self.resource_type is None) and
             len(self.resource_ids) == 0
+        ))
+    
+    def matches_all(self) -> bool:
+        """Check if this pattern matches all resources"""
+        return self._matches_all
+
+
+# Shared patterns handed out by PolicyBuilder.all_resources() / .service()
+_WILDCARD_RESOURCE = ResourcePattern(service="*")
+_SERVICE_RESOURCE_CACHE: Dict[str, ResourcePattern] = {}
+
+
+def _service_resource(service: str) -> ResourcePattern:
+    """Shared pattern matching every resource of a service"""
+    pattern = _SERVICE_RESOURCE_CACHE.get(service)
+    if pattern is None:
+        pattern = _SERVICE_RESOURCE_CACHE.setdefault(
+            service, ResourcePattern(service=service, resource_type="*")
         )
+    return pattern
 
 
-@dataclass
+_ALL_OPS = (
+    OperationType.READ,
+    OperationType.WRITE,
+    OperationType.DELETE,
+    OperationType.ANALYZE
+)
+_READ_OPS = (OperationType.READ,)
+_WRITE_OPS = (OperationType.WRITE,)
+_DELETE_OPS = (OperationType.DELETE,)
+
+
+@dataclass(frozen=True, slots=True)
 class PolicyStatement:
     """
     A single policy statement (similar to AWS IAM statement)
     
+    Immutable (operations and resources are stored as tuples) since the
+    operation mask and resource indexes are derived from them; use
+    dataclasses.replace() to build a modified statement. Operations may be
+    given as OperationType members or their string values.
+    
     Example:
         # Deny all delete operations on production resources
         PolicyStatement(
             effect=PolicyEffect.DENY,
             operations=[OperationType.DELETE],
             resources=[ResourcePattern(service="*")],
-            conditions=[
+            conditions=(
                 PolicyCondition(
                     key="tag:Environment",
                     operator=ConditionOperator.EQUALS,
                     value="production"
-                )
-            ]
+                ),
+            )
         )
     """
     sid: str  # Statement ID
     effect: PolicyEffect
-    operations: List[OperationType]  # Operations this applies to
-    resources: List[ResourcePattern]  # Resources this applies to
-    conditions: List[PolicyCondition] = field(default_factory=list)
+    operations: Tuple[OperationType, ...]  # Operations this applies to
+    resources: Tuple[ResourcePattern, ...]  # Resources this applies to
+    conditions: Tuple[PolicyCondition, ...] = ()
     description: Optional[str] = None
+    # Mirrors operations
+    _op_mask: OperationMask = field(default=OperationMask.NONE, init=False, repr=False, compare=False)
+    # Resource lookups derived from resources in __post_init__: (service,
+    # resource_type) pairs of ID-less patterns with "*" for wildcards, and the
+    # patterns naming IDs
+    _res_index: FrozenSet[Tuple[Optional[str], Optional[str]]] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _matches_any_resource: bool = field(default=False, init=False, repr=False, compare=False)
+    _id_patterns: Tuple[ResourcePattern, ...] = field(default=(), init=False, repr=False, compare=False)
+    # Services named by any resource pattern ("*" for wildcards)
+    _services: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'operations', tuple(OperationType(op) for op in self.operations))
+        object.__setattr__(self, 'resources', tuple(self.resources))
+        object.__setattr__(self, 'conditions', tuple(self.conditions))
+        object.__setattr__(self, '_op_mask', OperationMask.of(self.operations))
+        res_index = frozenset(
+            (r.service if r.service and r.service != "*" else "*",
+             r.resource_type if r.resource_type and r.resource_type != "*" else "*")
+            for r in self.resources if not r.resource_ids
+        )
+        object.__setattr__(self, '_res_index', res_index)
+        object.__setattr__(self, '_matches_any_resource', ("*", "*") in res_index)
+        object.__setattr__(self, '_id_patterns', tuple(r for r in self.resources if r.resource_ids))
+        object.__setattr__(self, '_services', frozenset(
+            r.service if r.service and r.service != "*" else "*" for r in self.resources
+        ))
+    
+    def applies_to(self, operation: OperationType) -> bool:
+        """Check if this statement applies to an operation (or its string value)"""
+        return bool(self._op_mask & OperationMask[OperationType(operation).name])
     
     def applies_to_all_operations(self) -> bool:
         """Check if this statement applies to all operations"""
-        return len(self.operations) == 4  # All operation types
+        return self._op_mask == OperationMask.ALL
+    
+    def covers_service(self, service: Optional[str]) -> bool:
+        """Check if any resource pattern could match a resource of this service"""
+        return "*" in self._services or service in self._services
+    
+    def matches(self, service: Optional[str], resource_type: Optional[str]) -> bool:
+        """Check if an ID-less resource pattern covers (service, resource_type)"""
+        if self._matches_any_resource:
+            return True
+        index = self._res_index
+        return (
+            (service, resource_type) in index or
+            ("*", resource_type) in index or
+            (service, "*") in index
+        )
+
+
+# Source of Policy generations (unique across policies, so a tuple of them
+# identifies a set of policies in a given state)
+_POLICY_GENERATIONS = itertools.count()
 
 
-@dataclass
+# Guards Policy.to_json_bytes() cache rebuilds (module-level so policies stay picklable)
+_TO_JSON_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class Policy:
     """
     A collection of policy statements
@@ -105,15 +269,126 @@ class Policy:
     """
     name: str
     version: str = "1.0"
-    statements: List[PolicyStatement] = field(default_factory=list)
+    # Stored as a tuple; change it with add_statement() or by assigning a new sequence
+    statements: Tuple[PolicyStatement, ...] = ()
     description: Optional[str] = None
+    # Lazily built (effect, operation) -> statements index, see statements_for()
+    _index: Optional[Dict[Tuple[PolicyEffect, OperationType], List[PolicyStatement]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Per-service narrowing of _index, built with it: one bucket per service named
+    # by a statement, plus a "*" bucket for services no statement names
+    _service_index: Optional[Dict[Tuple[PolicyEffect, OperationType, str], Tuple[PolicyStatement, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Cached to_json_bytes() result (immutable, so safe to share between callers)
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    # Changes whenever the policy does, see generation
+    _generation: int = field(
+        default_factory=lambda: next(_POLICY_GENERATIONS), init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name: str, value: Any):
+        # The indexes and to_json_bytes() cache are derived from the public fields, so
+        # assigning any of them drops those views
+        if name == 'statements':
+            value = tuple(value)
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            self.invalidate()
     
     def add_statement(self, statement: PolicyStatement):
         """Add a statement to this policy"""
-        self.statements.append(statement)
+        self.statements += (statement,)
+    
+    def copy(self) -> 'Policy':
+        """Copy of this policy (statements are immutable and shared)"""
+        copied = Policy(
+            name=self.name,
+            version=self.version,
+            statements=self.statements,
+            description=self.description
+        )
+        # The indexes are replaced rather than updated in place, so they can be shared too
+        copied._index = self._index
+        copied._service_index = self._service_index
+        return copied
+    
+    @property
+    def generation(self) -> int:
+        """Token that changes whenever the policy changes (for keying derived caches)"""
+        return self._generation
+    
+    def invalidate(self):
+        """Drop cached views of the statements"""
+        self._index = None
+        self._service_index = None
+        self._json = None
+        self._generation = next(_POLICY_GENERATIONS)
+    
+    def statements_for(
+        self,
+        effect: PolicyEffect,
+        operation: OperationType,
+        service: Optional[str] = None
+    ) -> Sequence[PolicyStatement]:
+        """
+        Statements with the given effect that apply to an operation, in declaration order
+        
+        If service is given, statements whose resource patterns cannot match that
+        service are left out.
+        """
+        if self._index is None:
+            index = {}
+            for statement in self.statements:
+                for op in dict.fromkeys(statement.operations):
+                    index.setdefault((statement.effect, op), []).append(statement)
+            # Keyed only on services the statements name, so lookups with
+            # arbitrary (LLM-derived) services never grow it
+            service_index = {}
+            for (bucket_effect, bucket_op), bucket in index.items():
+                named = {"*"}
+                for statement in bucket:
+                    named.update(statement._services)
+                for name in named:
+                    service_index[(bucket_effect, bucket_op, name)] = tuple(
+                        statement for statement in bucket if statement.covers_service(name)
+                    )
+            self._service_index = service_index
+            self._index = index
+        if service is None:
+            return self._index.get((effect, operation), ())
+        statements = self._service_index.get((effect, operation, service))
+        if statements is None:
+            statements = self._service_index.get((effect, operation, "*"), ())
+        return statements
+    
+    def candidates_for(
+        self,
+        effect: PolicyEffect,
+        operation: OperationType,
+        service: Optional[str],
+        resource_type: Optional[str]
+    ) -> Iterator[Tuple[PolicyStatement, bool]]:
+        """
+        (statement, resolved) pairs that can match a resource, in declaration order
+        
+        resolved is True for statements whose ID-less patterns cover the resource
+        and that have no conditions: those match any intent with this operation,
+        service and resource type. The rest still need a full match against the
+        intent. Statements that cannot match the resource are left out.
+        
+        Resource types come from the intent, so they are filtered per call
+        rather than memoized.
+        """
+        for statement in self.statements_for(effect, operation, service):
+            if statement.matches(service, resource_type):
+                yield statement, not statement.conditions
+            elif statement._id_patterns:
+                yield statement, False
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert policy to dictionary format"""
+        """Convert policy to dictionary format (a new dict on every call)"""
         return {
             "name": self.name,
             "version": self.version,
@@ -127,7 +402,7 @@ class Policy:
                         {
                             "service": r.service,
                             "resource_type": r.resource_type,
-                            "resource_ids": r.resource_ids
+                            "resource_ids": list(r.resource_ids)
                         }
                         for r in s.resources
                     ],
@@ -135,7 +410,8 @@ class Policy:
                         {
                             "key": c.key,
                             "operator": c.operator.value,
-                            "value": c.value
+                            # Copied so edits to the dict can't reach the condition
+                            "value": list(c.value) if isinstance(c.value, list) else c.value
                         }
                         for c in s.conditions
                     ],
@@ -144,6 +420,32 @@ class Policy:
                 for s in self.statements
             ]
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the policy to UTF-8 JSON (uses orjson when installed)
+        
+        The result is cached until the policy changes.
+        """
+        cached = self._json
+        if cached is None:
+            with _TO_JSON_LOCK:
+                cached = self._json
+                if cached is None:
+                    if ORJSON_AVAILABLE:
+                        cached = orjson.dumps(self.to_dict())
+                    else:
+                        cached = json.dumps(
+                            self.to_dict(), separators=(",", ":"), ensure_ascii=False
+                        ).encode("utf-8")
+                    self._json = cached
+        return cached
+
+
+@functools.lru_cache(maxsize=None)
+def _tag_key(tag_key: str) -> str:
+    """Interned condition key for a tag (e.g. "tag:Environment")"""
+    return sys.intern(f"tag:{tag_key}")
 
 
 # Policy Builder - Fluent API for easy policy construction
@@ -152,7 +454,14 @@ class PolicyBuilder:
     
     def __init__(self, name: str):
         self.policy = Policy(name=name)
-        self._current_statement: Optional[PolicyStatement] = None
+        # Parts of the statement being built; the PolicyStatement itself is
+        # only created in end_statement() (_sid is None when none is open)
+        self._sid: Optional[str] = None
+        self._effect = PolicyEffect.ALLOW
+        self._ops: Tuple[OperationType, ...] = ()
+        self._res: Tuple[ResourcePattern, ...] = ()
+        self._conds: Tuple[PolicyCondition, ...] = ()
+        self._desc: Optional[str] = None
     
     def with_description(self, description: str) -> 'PolicyBuilder':
         """Add description to policy"""
@@ -161,18 +470,18 @@ class PolicyBuilder:
     
     def statement(self, sid: str) -> 'PolicyBuilder':
         """Start a new statement"""
-        self._current_statement = PolicyStatement(
-            sid=sid,
-            effect=PolicyEffect.ALLOW,  # Default
-            operations=[],
-            resources=[]
-        )
+        self._sid = sid
+        self._effect = PolicyEffect.ALLOW  # Default
+        self._ops = ()
+        self._res = ()
+        self._conds = ()
+        self._desc = None
         return self
     
     def effect(self, effect: PolicyEffect) -> 'PolicyBuilder':
         """Set effect for current statement"""
-        if self._current_statement:
-            self._current_statement.effect = effect
+        if self._sid is not None:
+            self._effect = effect
         return self
     
     def allow(self) -> 'PolicyBuilder':
@@ -189,30 +498,29 @@ class PolicyBuilder:
     
     def operations(self, *ops: OperationType) -> 'PolicyBuilder':
         """Add operations to current statement"""
-        if self._current_statement:
-            self._current_statement.operations.extend(ops)
-        return self
+        return self._add_operations(ops)
     
     def all_operations(self) -> 'PolicyBuilder':
         """Apply to all operations"""
-        return self.operations(
-            OperationType.READ,
-            OperationType.WRITE,
-            OperationType.DELETE,
-            OperationType.ANALYZE
-        )
+        return self._add_operations(_ALL_OPS)
     
     def read_operations(self) -> 'PolicyBuilder':
         """Apply to read operations"""
-        return self.operations(OperationType.READ)
+        return self._add_operations(_READ_OPS)
     
     def write_operations(self) -> 'PolicyBuilder':
         """Apply to write operations"""
-        return self.operations(OperationType.WRITE)
+        return self._add_operations(_WRITE_OPS)
     
     def delete_operations(self) -> 'PolicyBuilder':
         """Apply to delete operations"""
-        return self.operations(OperationType.DELETE)
+        return self._add_operations(_DELETE_OPS)
+    
+    def _add_operations(self, ops: Tuple[OperationType, ...]) -> 'PolicyBuilder':
+        """Append operations to the current statement"""
+        if self._sid is not None:
+            self._ops += ops
+        return self
     
     def resource(
         self,
@@ -221,23 +529,27 @@ class PolicyBuilder:
         resource_ids: Optional[List[str]] = None
     ) -> 'PolicyBuilder':
         """Add a resource pattern to current statement"""
-        if self._current_statement:
-            self._current_statement.resources.append(
-                ResourcePattern(
-                    service=service,
-                    resource_type=resource_type,
-                    resource_ids=resource_ids or []
-                )
+        return self._add_resource(
+            ResourcePattern(
+                service=service,
+                resource_type=resource_type,
+                resource_ids=resource_ids or ()
             )
-        return self
+        )
     
     def all_resources(self) -> 'PolicyBuilder':
         """Apply to all resources"""
-        return self.resource(service="*")
+        return self._add_resource(_WILDCARD_RESOURCE)
     
     def service(self, service: str) -> 'PolicyBuilder':
         """Apply to all resources in a service"""
-        return self.resource(service=service, resource_type="*")
+        return self._add_resource(_service_resource(service))
+    
+    def _add_resource(self, pattern: ResourcePattern) -> 'PolicyBuilder':
+        """Append a resource pattern to the current statement"""
+        if self._sid is not None:
+            self._res += (pattern,)
+        return self
     
     def condition(
         self,
@@ -246,15 +558,13 @@ class PolicyBuilder:
         value: Union[str, List[str]]
     ) -> 'PolicyBuilder':
         """Add a condition to current statement"""
-        if self._current_statement:
-            self._current_statement.conditions.append(
-                PolicyCondition(key=key, operator=operator, value=value)
-            )
+        if self._sid is not None:
+            self._conds += (PolicyCondition(key=key, operator=operator, value=value),)
         return self
     
     def when_tag(self, tag_key: str, operator: ConditionOperator, value: Union[str, List[str]]) -> 'PolicyBuilder':
         """Add tag-based condition"""
-        return self.condition(f"tag:{tag_key}", operator, value)
+        return self.condition(_tag_key(tag_key), operator, value)
     
     def when_region(self, operator: ConditionOperator, value: Union[str, List[str]]) -> 'PolicyBuilder':
         """Add region-based condition"""
@@ -266,121 +576,177 @@ class PolicyBuilder:
     
     def description(self, desc: str) -> 'PolicyBuilder':
         """Add description to current statement"""
-        if self._current_statement:
-            self._current_statement.description = desc
+        if self._sid is not None:
+            self._desc = desc
         return self
     
     def end_statement(self) -> 'PolicyBuilder':
         """Finish current statement and add to policy"""
-        if self._current_statement:
-            self.policy.add_statement(self._current_statement)
-            self._current_statement = None
+        if self._sid is not None:
+            self.policy.add_statement(
+                PolicyStatement(
+                    sid=self._sid,
+                    effect=self._effect,
+                    operations=self._ops,
+                    resources=self._res,
+                    conditions=self._conds,
+                    description=self._desc
+                )
+            )
+            self._sid = None
         return self
     
     def build(self) -> Policy:
         """Build and return the policy"""
         # Add any pending statement
-        if self._current_statement:
+        if self._sid is not None:
             self.end_statement()
         return self.policy
 
 
 # Common Policy Templates
+#
+# Templates are plain module-level functions; PolicyTemplates exposes the same
+# functions as static methods. Parameter-free templates are built once, and
+# region_restrictions() once per region list; each call returns a copy, so
+# callers can extend the result without affecting others.
+
+def read_only() -> Policy:
+    """Allow only read operations"""
+    return _read_only().copy()
+
+
+@functools.cache
+def _read_only() -> Policy:
+    """Build (once) the read-only policy"""
+    return (
+        PolicyBuilder("read-only-policy")
+        .with_description("Allow only read operations, deny all modifications")
+        .statement("allow-reads")
+        .allow()
+        .read_operations()
+        .all_resources()
+        .end_statement()
+        .statement("deny-writes")
+        .deny()
+        .write_operations()
+        .all_resources()
+        .end_statement()
+        .statement("deny-deletes")
+        .deny()
+        .delete_operations()
+        .all_resources()
+        .end_statement()
+        .build()
+    )
+
+
+def deny_production_modifications() -> Policy:
+    """Deny all modifications to production resources"""
+    return _deny_production_modifications().copy()
+
+
+@functools.cache
+def _deny_production_modifications() -> Policy:
+    """Build (once) the production modification deny policy"""
+    return (
+        PolicyBuilder("deny-production-mods")
+        .with_description("Prevent modifications to production resources")
+        .statement("deny-prod-write")
+        .deny()
+        .operations(OperationType.WRITE, OperationType.DELETE)
+        .all_resources()
+        .when_tag("Environment", ConditionOperator.IN, ["production", "prod", "prd"])
+        .end_statement()
+        .build()
+    )
+
+
+def region_restrictions(allowed_regions: List[str]) -> Policy:
+    """Restrict operations to specific regions"""
+    return _region_restrictions(tuple(allowed_regions)).copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _region_restrictions(allowed_regions: Tuple[str, ...]) -> Policy:
+    """Build (once per region tuple) the region restriction policy"""
+    return (
+        PolicyBuilder("region-restrictions")
+        .with_description(f"Allow operations only in: {', '.join(allowed_regions)}")
+        .statement("deny-other-regions")
+        .deny()
+        .all_operations()
+        .all_resources()
+        .when_region(ConditionOperator.NOT_IN, list(allowed_regions))
+        .end_statement()
+        .build()
+    )
+
+
+def service_restrictions(allowed_services: List[str]) -> Policy:
+    """Restrict to specific AWS services"""
+    # One allow statement per service, built directly (no builder round-trips)
+    return Policy(
+        name="service-restrictions",
+        description=f"Allow access only to: {', '.join(allowed_services)}",
+        statements=[
+            PolicyStatement(
+                sid=f"allow-{service}",
+                effect=PolicyEffect.ALLOW,
+                operations=list(_ALL_OPS),
+                resources=[_service_resource(service)]
+            )
+            for service in allowed_services
+        ]
+    )
+
+
+def require_approval_for_critical() -> Policy:
+    """Require approval for all operations on critical resources"""
+    return _require_approval_for_critical().copy()
+
+
+@functools.cache
+def _require_approval_for_critical() -> Policy:
+    """Build (once) the critical resource approval policy"""
+    return (
+        PolicyBuilder("critical-resource-approval")
+        .with_description("Require approval for critical resources")
+        .statement("approval-for-critical")
+        .require_approval()
+        .all_operations()
+        .all_resources()
+        .when_tag("Critical", ConditionOperator.EQUALS, "true")
+        .end_statement()
+        .build()
+    )
+
+
+def specific_resource_deny(service: str, resource_ids: List[str]) -> Policy:
+    """Deny operations on specific resource IDs"""
+    return (
+        PolicyBuilder("specific-resource-deny")
+        .with_description(f"Deny operations on specific {service} resources")
+        .statement("deny-specific-resources")
+        .deny()
+        .all_operations()
+        .resource(service=service, resource_ids=resource_ids)
+        .end_statement()
+        .build()
+    )
+
+
 class PolicyTemplates:
-    """Pre-built policy templates for common scenarios"""
-    
-    @staticmethod
-    def read_only() -> Policy:
-        """Allow only read operations"""
-        return (
-            PolicyBuilder("read-only-policy")
-            .with_description("Allow only read operations, deny all modifications")
-            .statement("allow-reads")
-            .allow()
-            .read_operations()
-            .all_resources()
-            .end_statement()
-            .statement("deny-writes")
-            .deny()
-            .write_operations()
-            .all_resources()
-            .end_statement()
-            .statement("deny-deletes")
-            .deny()
-            .delete_operations()
-            .all_resources()
-            .end_statement()
-            .build()
-        )
-    
-    @staticmethod
-    def deny_production_modifications() -> Policy:
-        """Deny all modifications to production resources"""
-        return (
-            PolicyBuilder("deny-production-mods")
-            .with_description("Prevent modifications to production resources")
-            .statement("deny-prod-write")
-            .deny()
-            .operations(OperationType.WRITE, OperationType.DELETE)
-            .all_resources()
-            .when_tag("Environment", ConditionOperator.IN, ["production", "prod", "prd"])
-            .end_statement()
-            .build()
-        )
-    
-    @staticmethod
-    def region_restrictions(allowed_regions: List[str]) -> Policy:
-        """Restrict operations to specific regions"""
-        return (
-            PolicyBuilder("region-restrictions")
-            .with_description(f"Allow operations only in: {', '.join(allowed_regions)}")
-            .statement("deny-other-regions")
-            .deny()
-            .all_operations()
-            .all_resources()
-            .when_region(ConditionOperator.NOT_IN, allowed_regions)
-            .end_statement()
-            .build()
-        )
-    
-    @staticmethod
-    def service_restrictions(allowed_services: List[str]) -> Policy:
-        """Restrict to specific AWS services"""
-        policy = PolicyBuilder("service-restrictions").with_description(
-            f"Allow access only to: {', '.join(allowed_services)}"
-        )
-        
-        # Add allow statement for each service
-        for service in allowed_services:
-            policy.statement(f"allow-{service}").allow().all_operations().service(service).end_statement()
-        
-        return policy.build()
+    """
+    Pre-built policy templates for common scenarios
     
-    @staticmethod
-    def require_approval_for_critical() -> Policy:
-        """Require approval for all operations on critical resources"""
-        return (
-            PolicyBuilder("critical-resource-approval")
-            .with_description("Require approval for critical resources")
-            .statement("approval-for-critical")
-            .require_approval()
-            .all_operations()
-            .all_resources()
-            .when_tag("Critical", ConditionOperator.EQUALS, "true")
-            .end_statement()
-            .build()
-        )
+    Each call returns a policy of its own, so it can be extended with
+    add_statement() without affecting other callers.
+    """
     
-    @staticmethod
-    def specific_resource_deny(service: str, resource_ids: List[str]) -> Policy:
-        """Deny operations on specific resource IDs"""
-        return (
-            PolicyBuilder("specific-resource-deny")
-            .with_description(f"Deny operations on specific {service} resources")
-            .statement("deny-specific-resources")
-            .deny()
-            .all_operations()
-            .resource(service=service, resource_ids=resource_ids)
-            .end_statement()
-            .build()
-        )
\ No newline at end of file
+    read_only = staticmethod(read_only)
+    deny_production_modifications = staticmethod(deny_production_modifications)
+    region_restrictions = staticmethod(region_restrictions)
+    service_restrictions = staticmethod(service_restrictions)
+    require_approval_for_critical = staticmethod(require_approval_for_critical)
+    specific_resource_deny = staticmethod(specific_resource_deny)
@@ -0,0 +1,42 @@
+"""
+Shared pytest fixtures for the test suites
+"""
+
+import logging
+import os
+import pytest
+
+
+# Environment the mocked Bedrock clients run under
+TEST_ENV = {
+    'BEDROCK_MODEL_ID': 'test-model',
+    'AWS_REGION': 'us-east-1'
+}
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _bedrock_env():
+    """Set the test environment once per session and restore it afterwards"""
+    saved = {key: os.environ.get(key) for key in TEST_ENV}
+    os.environ.update(TEST_ENV)
+    yield
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _test_log_level():
+    """
+    Set the root log level from TEST_LOG_LEVEL (default INFO).
+    
+    The print_result / print_test_result helpers log at DEBUG, so their
+    output is only formatted when TEST_LOG_LEVEL=DEBUG.
+    """
+    root = logging.getLogger()
+    saved = root.level
+    root.setLevel(os.environ.get('TEST_LOG_LEVEL', 'INFO'))
+    yield
+    root.setLevel(saved)
@@ -9,10 +9,51 @@ Tests all validation layers:
 5. Multi-turn conversations
 """
 
-import datetime
+import contextlib
+import io
+import itertools
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+import pytest
 from ..policy.intent_gate import IntentGate, IntentGateWithHistory, GateDecision
 from ..llm.intent_schema import (ExtractedIntent, OperationType, ConfidenceLevel, AWSResource, ResourceFilter)
-from ..policy.policy_schema import PolicyBuilder, ConditionOperator
+from ..policy.policy_schema import (
+    PolicyBuilder, ConditionOperator, PolicyEffect, PolicyTemplates,
+    Policy, PolicyStatement, PolicyCondition, ResourcePattern, OperationMask
+)
+from ..policy.policy_engine import PolicyEngine
+from ..policy import intent_gate, policy_schema
+
+
+logger = logging.getLogger(__name__)
+
+# Gate logic never reads the timestamp, so every test intent shares one
+_FROZEN_TS = "2024-01-01T00:00:00+00:00"
+
+# Resource for the common case (ec2 instances, no ids or filters); the gate
+# only reads resources, so intents can share it
+_DEFAULT_RESOURCE = AWSResource(service="ec2", resource_type="instance")
+
+# Validated once; create_intent derives every test intent from it with
+# model_copy, which skips validation. Fields create_intent does not set
+# (accounts, sub_intents, ...) are shared with the prototype - don't mutate them.
+_PROTO_INTENT = ExtractedIntent(
+    query_type="simple",
+    operation=OperationType.READ,
+    confidence=ConfidenceLevel.HIGH,
+    primary_service="ec2",
+    primary_resource=_DEFAULT_RESOURCE,
+    action="test",
+    regions=["us-east-1"],
+    original_query="test query",
+    normalized_query="test query",
+    timestamp=_FROZEN_TS
+)
 
 
 def create_intent(
@@ -25,55 +66,61 @@ def create_intent(
     regions: list = None,
     action: str = "test",
     ambiguities: list = None,
-    query_type: str = "simple"
+    query_type: str = "simple",
+    limit: int = None
 ):
     """Helper to create test intents"""
-    return ExtractedIntent(
-        query_type=query_type,
-        operation=operation,
-        confidence=confidence,
-        primary_service=service,
-        primary_resource=AWSResource(
+    if service == "ec2" and resource_type == "instance" and not resource_ids and not filters:
+        resource = _DEFAULT_RESOURCE
+    else:
+        resource = AWSResource(
             service=service,
             resource_type=resource_type,
             resource_ids=resource_ids or [],
             filters=filters or []
-        ),
-        action=action,
-        regions=regions if regions is not None else ["us-east-1"],
-        ambiguities=ambiguities or [],
-        original_query="test query",
-        normalized_query="test query",
-        timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat()
-    )
+        )
+    return _PROTO_INTENT.model_copy(update={
+        'query_type': query_type,
+        'operation': operation,
+        'confidence': confidence,
+        'primary_service': service,
+        'primary_resource': resource,
+        'action': action,
+        'regions': regions if regions is not None else ["us-east-1"],
+        'ambiguities': ambiguities or [],
+        'limit': limit
+    })
 
 
 def print_result(test_name: str, result, expected_decision: GateDecision = None):
-    """Print test result"""
-    print(f"\n{'='*80}")
-    print(f"TEST: {test_name}")
-    print(f"{'='*80}")
-    print(f"🚦 Decision: {result.decision.value.upper()}")
-    print(f"📋 Reasoning: {result.reasoning}")
+    """Log test result at DEBUG (set TEST_LOG_LEVEL=DEBUG to see it)"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return result
+    
+    logger.debug("\n%s", "="*80)
+    logger.debug("TEST: %s", test_name)
+    logger.debug("%s", "="*80)
+    logger.debug("🚦 Decision: %s", result.decision.value.upper())
+    logger.debug("📋 Reasoning: %s", result.reasoning)
     
     if result.clarifying_questions:
-        print("\n❓ Clarifying Questions:")
+        logger.debug("\n❓ Clarifying Questions:")
         for q in result.clarifying_questions:
-            print(f"   • {q}")
+            logger.debug("   • %s", q)
     
     if result.required_confirmations:
-        print("\n⚠️  Required Confirmations:")
+        logger.debug("\n⚠️  Required Confirmations:")
         for c in result.required_confirmations:
-            print(f"   • {c}")
+            logger.debug("   • %s", c)
     
     if result.warnings:
-        print("\n⚡ Warnings:")
+        logger.debug("\n⚡ Warnings:")
         for w in result.warnings:
-            print(f"   • {w}")
+            logger.debug("   • %s", w)
     
     if expected_decision:
         status = "✅ PASS" if result.decision == expected_decision else "❌ FAIL"
-        print(f"\n{status} - Expected: {expected_decision.value}, Got: {result.decision.value}")
+        logger.debug("\n%s - Expected: %s, Got: %s", status, expected_decision.value, result.decision.value)
     
     return result
 
@@ -123,14 +170,17 @@ def test_suite_1_basic_reads():
     # Test 1.4: Read different services
     print("\n--- Test 1.4: READ various services ---")
     services = ["s3", "lambda", "dynamodb", "cloudwatch"]
-    for service in services:
-        intent = create_intent(
+    intents = [
+        create_intent(
             operation=OperationType.READ,
             service=service,
             confidence=ConfidenceLevel.HIGH,
             action="list"
         )
-        result = gate.evaluate(intent)
+        for service in services
+    ]
+    results = gate.evaluate_many(intents)
+    for service, result in zip(services, results):
         print(f"   {service}: {result.decision.value}")
 
 
@@ -178,6 +228,13 @@ def test_suite_2_write_operations():
     )
     result = print_result("WRITE without region", gate.evaluate(intent), GateDecision.CLARIFY)
     
+    # Test 2.3b: Missing region is settled before the policy engine runs
+    gate.clear_evaluation_cache()
+    with patch.object(gate.policy_engine, "evaluate") as policy_evaluate:
+        gate.evaluate(intent)
+    assert not policy_evaluate.called
+    print("   ✅ policy engine skipped")
+    
     # Test 2.4: Write without action (should CLARIFY)
     print("\n--- Test 2.4: WRITE without action ---")
     intent = create_intent(
@@ -232,6 +289,13 @@ def test_suite_3_delete_operations():
         action="delete"
     )
     result = print_result("Low confidence DELETE", gate.evaluate(intent), GateDecision.CLARIFY)
+    
+    # Test 3.3b: Low confidence is settled before the policy engine runs
+    gate.clear_evaluation_cache()
+    with patch.object(gate.policy_engine, "evaluate") as policy_evaluate:
+        gate.evaluate(intent)
+    assert not policy_evaluate.called
+    print("   ✅ policy engine skipped")
 
 
 # ============================================================================
@@ -292,6 +356,15 @@ def test_suite_4_protected_resources():
         ]
     )
     result = print_result("WRITE to development resource", gate.evaluate(intent), GateDecision.CONFIRM)
+    
+    # Test 4.4: Reassigned protected patterns take effect
+    print("\n--- Test 4.4: Reassigned protected patterns ---")
+    gate.protected_patterns = ["development"]
+    assert gate.protected_patterns == ("development",)
+    assert gate._check_protected_resources(intent) == ["development"]
+    gate.protected_patterns = []
+    assert gate._check_protected_resources(intent) == []
+    print("   ✅ matchers rebuilt on assignment")
 
 
 # ============================================================================
@@ -359,20 +432,27 @@ def test_suite_6_resource_constraints():
         operation=OperationType.WRITE,
         service="ec2",
         confidence=ConfidenceLevel.HIGH,
-        action="stop"
+        action="stop",
+        limit=100  # Exceeds max of 50
     )
-    intent.limit = 100  # Exceeds max of 50
     result = print_result("WRITE with limit=100 (max=50)", gate.evaluate(intent), GateDecision.REJECT)
     
+    # Test 6.1b: The limit is checked before the policy engine runs
+    gate.clear_evaluation_cache()
+    with patch.object(gate.policy_engine, "evaluate") as policy_evaluate:
+        gate.evaluate(intent)
+    assert not policy_evaluate.called
+    print("   ✅ policy engine skipped")
+    
+    # Test 6.1c: An over-limit write without a region is refused, not clarified
+    print("\n--- Test 6.1c: WRITE with excessive limit and no region ---")
+    no_region = intent.model_copy(update={'regions': []})
+    result = print_result("WRITE with limit=100, no region", gate.evaluate(no_region), GateDecision.REJECT)
+    assert result.decision == GateDecision.REJECT
+    
     # Test 6.2: Acceptable limit (should CONFIRM)
     print("\n--- Test 6.2: WRITE with acceptable limit ---")
-    intent = create_intent(
-        operation=OperationType.WRITE,
-        service="ec2",
-        confidence=ConfidenceLevel.HIGH,
-        action="stop"
-    )
-    intent.limit = 30  # Within limit
+    intent = intent.model_copy(update={'limit': 30})  # Same WRITE as 6.1, within limit
     result = print_result("WRITE with limit=30 (max=50)", gate.evaluate(intent), GateDecision.CONFIRM)
 
 
@@ -415,6 +495,14 @@ def test_suite_7_confirmation_flow():
     print("\n--- Test 7.4: Ambiguous response ---")
     ambiguous = gate.process_confirmation(result, "maybe")
     print_result("After ambiguous response", ambiguous, GateDecision.CONFIRM)
+    
+    # Test 7.5: Phrases inside a longer reply, confirmation taking precedence
+    print("\n--- Test 7.5: Phrases within a reply ---")
+    mixed = gate.process_confirmation(result, "Yes, stop them")
+    print_result("After 'Yes, stop them'", mixed, GateDecision.PROCEED)
+    assert mixed.intent is result.intent
+    assert mixed.warnings == result.warnings
+    assert gate.process_confirmation(result, "please abort").decision == GateDecision.REJECT
 
 
 # ============================================================================
@@ -462,6 +550,19 @@ def test_suite_8_multi_turn():
     
     # Cleanup
     gate.clear_pending(conv_id)
+    
+    # Turn 4: Pending clarifications expire and are bounded
+    print("\n--- Turn 4: Pending clarification expiry ---")
+    expiring = IntentGateWithHistory(config={'conv_ttl_sec': 0})
+    expiring.evaluate(intent1, conv_id)
+    assert expiring.process_followup(conv_id, "us-east-1", intent2) is None
+    
+    bounded = IntentGateWithHistory(config={'conv_cache_size': 1})
+    bounded.evaluate(intent1, "conversation-a")
+    bounded.evaluate(intent1, "conversation-b")
+    assert bounded.process_followup("conversation-a", "us-east-1", intent2) is None
+    assert bounded.process_followup("conversation-b", "us-east-1", intent2).decision == GateDecision.CONFIRM
+    print("   ✅ expired and evicted conversations dropped")
 
 
 # ============================================================================
@@ -508,6 +609,16 @@ def test_suite_9_custom_policies():
         action="list"
     )
     result = print_result("S3 READ with custom policy", gate.evaluate(intent), GateDecision.REJECT)
+    
+    # Test 9.3: Extending one gate's default policies leaves other gates alone
+    print("\n--- Test 9.3: Default policies are per gate ---")
+    extended_gate = IntentGate(enable_policies=True)
+    extended_gate.policy_engine.policies[0].add_statement(
+        PolicyBuilder("deny-s3").statement("deny-s3-reads").deny().read_operations().service("s3").build().statements[0]
+    )
+    assert extended_gate.evaluate(intent).decision == GateDecision.REJECT
+    assert IntentGate(enable_policies=True).evaluate(intent).decision == GateDecision.PROCEED
+    print("   ✅ other gates keep the default policies")
 
 
 # ============================================================================
@@ -577,28 +688,380 @@ def test_suite_10_edge_cases():
     result = print_result("READ with filters, no resource type", gate.evaluate(intent), GateDecision.CLARIFY)
 
 
+# ============================================================================
+# TEST SUITE 11: POLICY ENGINE EVALUATION MODES
+# ============================================================================
+
+def test_suite_11_policy_engine_modes():
+    """Test that fast (short-circuit) evaluation agrees with detailed evaluation"""
+    print("\n" + "="*80)
+    print("TEST SUITE 11: POLICY ENGINE EVALUATION MODES")
+    print("="*80)
+    
+    policies = [
+        PolicyTemplates.deny_production_modifications(),
+        PolicyTemplates.require_approval_for_critical(),
+        PolicyBuilder("mixed")
+        .statement("allow-reads").allow().read_operations().all_resources().end_statement()
+        .statement("allow-writes").allow().write_operations().all_resources().end_statement()
+        .statement("deny-deletes").deny().delete_operations().all_resources().end_statement()
+        .build()
+    ]
+    engine = PolicyEngine(policies)
+    fast_engine = PolicyEngine(policies, short_circuit=True)
+    
+    intents = [
+        create_intent(operation=OperationType.READ),
+        create_intent(operation=OperationType.WRITE, resource_ids=["i-12345"]),
+        create_intent(operation=OperationType.DELETE),
+        create_intent(operation=OperationType.ANALYZE),
+        create_intent(
+            operation=OperationType.WRITE,
+            filters=[ResourceFilter(filter_type="tag", key="Critical", value="true", operator="equals")]
+        ),
+        create_intent(
+            operation=OperationType.WRITE,
+            filters=[ResourceFilter(filter_type="tag", key="Environment", value="prod", operator="equals")]
+        ),
+    ]
+    
+    # Test 11.1: Same effect in both modes, at most one statement kept
+    print("\n--- Test 11.1: Fast vs detailed evaluation ---")
+    for intent in intents:
+        detailed = engine.evaluate(intent)
+        fast = fast_engine.evaluate(intent)
+        print(f"   {intent.operation.value}: detailed={detailed.effect.value}, fast={fast.effect.value}")
+        assert fast.effect == detailed.effect
+        assert fast.requires_approval == detailed.requires_approval
+        assert len(fast.matched_statements) <= 1
+    
+    # Test 11.2: Explicit detailed flag overrides the engine default
+    print("\n--- Test 11.2: Per-call detailed flag ---")
+    critical_write = intents[4]
+    assert fast_engine.evaluate(critical_write, detailed=True).effect == PolicyEffect.REQUIRE_APPROVAL
+    assert engine.evaluate(critical_write, detailed=False).effect == PolicyEffect.REQUIRE_APPROVAL
+    print("   ✅ detailed flag honored")
+    
+    # Test 11.3: Service-narrowed statement lookup keeps only statements that can match
+    print("\n--- Test 11.3: Per-service statement index ---")
+    scoped = (
+        PolicyBuilder("scoped")
+        .statement("deny-s3-writes").deny().write_operations().service("s3").end_statement()
+        .statement("deny-all-writes").deny().write_operations().all_resources().end_statement()
+        .build()
+    )
+    assert [st.sid for st in scoped.statements_for(PolicyEffect.DENY, OperationType.WRITE, "ec2")] == ["deny-all-writes"]
+    assert [st.sid for st in scoped.statements_for(PolicyEffect.DENY, OperationType.WRITE, "s3")] == ["deny-s3-writes", "deny-all-writes"]
+    assert [(st.sid, resolved) for st, resolved in scoped.candidates_for(
+        PolicyEffect.DENY, OperationType.WRITE, "ec2", "instance"
+    )] == [("deny-all-writes", True)]
+    indexed = len(scoped._service_index)
+    for service in ("lambda", "dynamodb", "not-a-service"):
+        assert [st.sid for st in scoped.statements_for(PolicyEffect.DENY, OperationType.WRITE, service)] == ["deny-all-writes"]
+    assert len(scoped._service_index) == indexed
+    print("   ✅ statements narrowed by service")
+    
+    # Test 11.4: Statements are immutable and templates extend via copies
+    print("\n--- Test 11.4: Immutable statements, copied templates ---")
+    statement = scoped.statements[0]
+    try:
+        statement.operations = (OperationType.READ,)
+        assert False, "PolicyStatement should be frozen"
+    except FrozenInstanceError:
+        pass
+    assert statement.applies_to(OperationType.WRITE) and not statement.applies_to(OperationType.READ)
+    template = PolicyTemplates.read_only()
+    extended = template.copy()
+    extended.add_statement(statement)
+    assert len(extended.statements) == len(template.statements) + 1
+    assert statement not in template.statements
+    template.add_statement(statement)
+    for fresh in (PolicyTemplates.read_only(), PolicyTemplates.deny_production_modifications(),
+                  PolicyTemplates.require_approval_for_critical()):
+        assert fresh is not template and statement not in fresh.statements
+    regional = PolicyTemplates.region_restrictions(["us-east-1"])
+    regional.add_statement(statement)
+    assert statement not in PolicyTemplates.region_restrictions(["us-east-1"]).statements
+    print("   ✅ templates unchanged by extending returned policies")
+    
+    # Test 11.5: Statement changes after the indexes are built are enforced
+    print("\n--- Test 11.5: Statements changed after first use ---")
+    policy = PolicyBuilder("late").statement("allow-writes").allow().write_operations().all_resources().build()
+    late_engine = PolicyEngine([policy])
+    write = create_intent(operation=OperationType.WRITE, action="stop", resource_ids=["i-1"])
+    assert late_engine.evaluate(write).effect == PolicyEffect.ALLOW
+    try:
+        policy.statements.append(scoped.statements[1])
+        assert False, "Policy.statements should not be mutable in place"
+    except AttributeError:
+        pass
+    policy.add_statement(scoped.statements[1])
+    assert late_engine.evaluate(write).effect == PolicyEffect.DENY
+    policy.statements = policy.statements[:1]
+    assert late_engine.evaluate(write).effect == PolicyEffect.ALLOW
+    assert [st["sid"] for st in policy.to_dict()["statements"]] == ["allow-writes"]
+    print("   ✅ indexes rebuilt after statements change")
+    
+    # Test 11.6: Operations given as string values
+    print("\n--- Test 11.6: String operations ---")
+    by_value = PolicyStatement(
+        sid="deny-writes", effect=PolicyEffect.DENY, operations=["write"], resources=[ResourcePattern(service="*")]
+    )
+    assert by_value.operations == (OperationType.WRITE,)
+    assert by_value.applies_to("write") and by_value.applies_to(OperationType.WRITE)
+    assert not by_value.applies_to("read")
+    assert OperationMask.of(["read", OperationType.DELETE]) == OperationMask.READ | OperationMask.DELETE
+    assert PolicyEngine([Policy(name="by-value", statements=[by_value])]).evaluate(write).effect == PolicyEffect.DENY
+    print("   ✅ string operations coerced to OperationType")
+    
+    # Test 11.7: Precompiled MATCHES patterns and IN/NOT_IN sets agree with plain checks
+    print("\n--- Test 11.7: Precompiled condition values ---")
+    subjects = ["us-east-1", "US-West-2", "eu-west-1", "i-PROD-1", "", "True", 42]
+    for operator, value, reference in (
+        (ConditionOperator.MATCHES, "us-.*", lambda actual: bool(re.match("us-.*", actual))),
+        (ConditionOperator.MATCHES, "I-prod", lambda actual: bool(re.match("i-prod", actual))),
+        (ConditionOperator.MATCHES, "[a-z]+-west-[0-9]$", lambda actual: bool(re.match("[a-z]+-west-[0-9]$", actual))),
+        (ConditionOperator.IN, ["us-east-1", "EU-WEST-1", True], lambda actual: actual in ["us-east-1", "eu-west-1", "true"]),
+        (ConditionOperator.IN, "us-east-1", lambda actual: actual in ["us-east-1"]),
+        (ConditionOperator.NOT_IN, ["us-east-1", 42], lambda actual: actual not in ["us-east-1", "42"]),
+    ):
+        condition = PolicyCondition(key="region", operator=operator, value=value)
+        for subject in subjects:
+            assert engine._evaluate_condition_operator(condition, subject) == reference(str(subject).lower()), (operator, value, subject)
+    print("   ✅ precompiled conditions match re.match and list membership")
+    
+    # Test 11.8: Serialized forms follow policy changes and can't be edited through
+    print("\n--- Test 11.8: Policy serialization ---")
+    regional = PolicyTemplates.region_restrictions(["us-east-1", "eu-west-1"])
+    as_dict = regional.to_dict()
+    as_dict["statements"][0]["conditions"][0]["value"].append("ap-south-1")
+    as_dict["statements"].clear()
+    assert regional.to_dict()["statements"][0]["conditions"][0]["value"] == ["us-east-1", "eu-west-1"]
+    assert regional.statements[0].conditions[0].value == ["us-east-1", "eu-west-1"]
+    serialized = regional.to_json_bytes()
+    assert regional.to_json_bytes() is serialized
+    regional.add_statement(by_value)
+    assert [st["sid"] for st in regional.to_dict()["statements"]] == ["deny-other-regions", "deny-writes"]
+    assert json.loads(regional.to_json_bytes()) == regional.to_dict()
+    regional.description = "changed"
+    assert json.loads(regional.to_json_bytes())["description"] == "changed"
+    print("   ✅ to_dict returns new dicts, cached JSON follows changes")
+
+
+# ============================================================================
+# TEST SUITE 12: EVALUATION CACHE
+# ============================================================================
+
+def test_suite_12_evaluation_cache():
+    """Test that repeated intents are served from the gate's evaluation cache"""
+    print("\n" + "="*80)
+    print("TEST SUITE 12: EVALUATION CACHE")
+    print("="*80)
+    
+    assert IntentGate().evaluation_cache_size == 0
+    gate = IntentGate(config={'evaluation_cache_size': 128}, enable_policies=True)
+    
+    # Test 12.1: Structurally identical intent skips the policy engine
+    print("\n--- Test 12.1: Cache hit ---")
+    first = gate.evaluate(create_intent(operation=OperationType.WRITE, action="stop", resource_ids=["i-12345"]))
+    repeat = create_intent(operation=OperationType.WRITE, action="stop", resource_ids=["i-12345"])
+    with patch.object(gate.policy_engine, "evaluate") as policy_evaluate:
+        result = gate.evaluate(repeat)
+    assert not policy_evaluate.called
+    assert result.decision == first.decision == GateDecision.CONFIRM
+    assert result.intent is repeat
+    print("   ✅ cached decision re-issued for the new intent")
+    
+    # Test 12.2: Adding a policy invalidates cached results
+    print("\n--- Test 12.2: Invalidation on policy change ---")
+    gate.add_policy(
+        PolicyBuilder("deny-ec2-writes")
+        .statement("deny-ec2-writes").deny().write_operations().service("ec2").end_statement()
+        .build()
+    )
+    result = print_result("WRITE after deny policy added", gate.evaluate(repeat), GateDecision.REJECT)
+    assert result.decision == GateDecision.REJECT
+    
+    # Test 12.3: Batch evaluation matches one-by-one evaluation and dedups repeats
+    print("\n--- Test 12.3: Batch evaluation ---")
+    uncached = IntentGate(config={'evaluation_cache_size': 0})
+    intents = [
+        create_intent(operation=OperationType.READ),
+        create_intent(operation=OperationType.WRITE, action="stop", resource_ids=["i-12345"]),
+        create_intent(operation=OperationType.READ),
+        create_intent(operation=OperationType.DELETE, action="terminate"),
+    ]
+    expected = [uncached.evaluate(intent).decision for intent in intents]
+    with patch.object(uncached, "_evaluate", wraps=uncached._evaluate) as evaluate_one:
+        results = uncached.evaluate_many(intents)
+    assert [result.decision for result in results] == expected
+    assert all(result.intent is intent for result, intent in zip(results, intents))
+    assert evaluate_one.call_count == 3
+    print(f"   ✅ {len(intents)} intents evaluated with {evaluate_one.call_count} gate passes")
+    
+    # Test 12.4: Concurrent evaluation with constant eviction stays consistent
+    print("\n--- Test 12.4: Concurrent evaluation ---")
+    small = IntentGate(config={'evaluation_cache_size': 2})
+    variants = [
+        create_intent(operation=OperationType.READ, service=service, action=action)
+        for service in ("ec2", "s3", "rds")
+        for action in ("list", "describe")
+    ]
+    expected = [small.evaluate(intent).decision for intent in variants]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        decisions = list(executor.map(lambda intent: small.evaluate(intent).decision, variants * 200))
+    assert decisions == expected * 200
+    print("   ✅ no errors under concurrent eviction")
+    
+    # Test 12.5: Cached error results don't share the intent's questions list
+    print("\n--- Test 12.5: Error result owns its questions ---")
+    error_intent = create_intent(operation=OperationType.READ, query_type="error").model_copy(
+        update={'clarifying_questions': ["Could you rephrase?"]}
+    )
+    error_result = gate.evaluate(error_intent)
+    assert error_result.clarifying_questions == error_intent.clarifying_questions
+    assert error_result.clarifying_questions is not error_intent.clarifying_questions
+    print("   ✅ questions copied into the result")
+    
+    # Test 12.6: Changing policies or settings behind the gate's back is not served stale
+    print("\n--- Test 12.6: Stale results after direct changes ---")
+    tracked = IntentGate(config={'evaluation_cache_size': 128}, enable_policies=True)
+    read = create_intent(operation=OperationType.READ)
+    assert tracked.evaluate(read).decision == GateDecision.PROCEED
+    tracked.policy_engine.policies[1].add_statement(
+        PolicyBuilder("deny").statement("deny-reads").deny().read_operations().all_resources().build().statements[0]
+    )
+    assert tracked.evaluate(read).decision == GateDecision.REJECT
+    tracked.policy_engine.policies.pop()
+    tracked.policy_engine.add_policy(PolicyTemplates.read_only())
+    assert tracked.evaluate(read).decision == GateDecision.PROCEED
+    limited = IntentGate(config={'evaluation_cache_size': 128}, enable_policies=True)
+    bulk_write = create_intent(operation=OperationType.WRITE, action="stop", resource_ids=["i-1"], limit=50)
+    assert limited.evaluate(bulk_write).decision == GateDecision.CONFIRM
+    limited.max_resource_limit = 10
+    assert limited.evaluate(bulk_write).decision == GateDecision.REJECT
+    print("   ✅ policy and settings changes bypass cached results")
+
+
+# ============================================================================
+# OPTIONAL BACKENDS (pytest only: these swap module-level backend flags)
+# ============================================================================
+
+def _serialization_policies():
+    """Policies covering every serialized field, including non-ASCII text"""
+    unicode_policy = (
+        PolicyBuilder("unicode")
+        .with_description("Ne modifiez pas la production – ✓")
+        .statement("deny-tagged").deny().all_operations().resource("ec2", "instance", ["i-1", "i-2"])
+        .when_tag("Owner", ConditionOperator.IN, ["équipe", "ops"])
+        .end_statement()
+        .build()
+    )
+    return [
+        PolicyTemplates.read_only(),
+        PolicyTemplates.region_restrictions(["us-east-1"]),
+        PolicyTemplates.service_restrictions(["ec2", "s3"]),
+        unicode_policy,
+    ]
+
+
+def test_policy_json_bytes_stdlib(monkeypatch):
+    """Stdlib encoding is compact UTF-8 JSON of to_dict()"""
+    monkeypatch.setattr(policy_schema, "ORJSON_AVAILABLE", False)
+    for policy in _serialization_policies():
+        encoded = policy.to_json_bytes()
+        assert json.loads(encoded) == policy.to_dict()
+        assert encoded == json.dumps(policy.to_dict(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def test_policy_json_bytes_orjson_matches_stdlib(monkeypatch):
+    """orjson and stdlib encodings are byte-identical"""
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(policy_schema, "orjson", orjson, raising=False)
+    for policy in _serialization_policies():
+        monkeypatch.setattr(policy_schema, "ORJSON_AVAILABLE", False)
+        policy.invalidate()
+        stdlib = policy.to_json_bytes()
+        monkeypatch.setattr(policy_schema, "ORJSON_AVAILABLE", True)
+        policy.invalidate()
+        assert policy.to_json_bytes() == stdlib
+
+
+def test_protected_pattern_automaton_matches_fallback(monkeypatch):
+    """Aho-Corasick and substring matching find the same protected patterns"""
+    pytest.importorskip("ahocorasick")
+    automaton_gate = IntentGate()
+    with monkeypatch.context() as patched:
+        patched.setattr(intent_gate, "AHOCORASICK_AVAILABLE", False)
+        fallback_gate = IntentGate()
+    intents = [
+        create_intent(operation=OperationType.WRITE, resource_ids=resource_ids, filters=filters)
+        for resource_ids, filters in (
+            (["i-production-1", "i-dev-2"], None),
+            (["db-MAIN-replica", "prodmain"], None),
+            (["i-staging"], [ResourceFilter(filter_type="name", key="Name", value="Mainframe-PRD")]),
+            (None, [ResourceFilter(filter_type="tag", key="Env", value="Pre-Production")]),
+            (["i-1"], [ResourceFilter(filter_type="tag", key="Count", value=3)]),
+        )
+    ]
+    
+    def assert_same_matches():
+        assert automaton_gate._protected_automaton is not None
+        assert fallback_gate._protected_automaton is None
+        for intent in intents:
+            assert (sorted(automaton_gate._check_protected_resources(intent)) ==
+                    sorted(fallback_gate._check_protected_resources(intent)))
+    
+    assert_same_matches()
+    for patterns in (["PRD", "prd", "stag", "main"], ["i-", "1", "pre-prod", "Production"]):
+        automaton_gate.protected_patterns = patterns
+        with monkeypatch.context() as patched:
+            patched.setattr(intent_gate, "AHOCORASICK_AVAILABLE", False)
+            fallback_gate.protected_patterns = patterns
+        assert_same_matches()
+
+
 # ============================================================================
 # RUN ALL TESTS
 # ============================================================================
 
+def _run_suite(suite, log_level: str) -> str:
+    """Run one suite in a worker process, returning everything it printed or logged"""
+    buffer = io.StringIO()
+    logging.basicConfig(level=log_level, format="%(message)s", stream=buffer, force=True)
+    with contextlib.redirect_stdout(buffer):
+        suite()
+    return buffer.getvalue()
+
+
 def run_all_tests():
-    """Run all test suites"""
+    """Run all test suites (in parallel worker processes, output kept in suite order)"""
     print("\n" + "="*80)
     print("INTENT GATE - COMPREHENSIVE TEST SUITE")
     print("="*80)
     print("Testing all validation layers and decision paths")
     print("="*80)
     
-    test_suite_1_basic_reads()
-    test_suite_2_write_operations()
-    test_suite_3_delete_operations()
-    test_suite_4_protected_resources()
-    test_suite_5_ambiguities()
-    test_suite_6_resource_constraints()
-    test_suite_7_confirmation_flow()
-    test_suite_8_multi_turn()
-    test_suite_9_custom_policies()
-    test_suite_10_edge_cases()
+    suites = [
+        test_suite_1_basic_reads,
+        test_suite_2_write_operations,
+        test_suite_3_delete_operations,
+        test_suite_4_protected_resources,
+        test_suite_5_ambiguities,
+        test_suite_6_resource_constraints,
+        test_suite_7_confirmation_flow,
+        test_suite_8_multi_turn,
+        test_suite_9_custom_policies,
+        test_suite_10_edge_cases,
+        test_suite_11_policy_engine_modes,
+        test_suite_12_evaluation_cache,
+    ]
+    # Suites share no state, so each runs in its own worker; buffered output
+    # is printed in suite order as the results come back
+    log_level = logging.getLevelName(logging.getLogger().getEffectiveLevel())
+    with ProcessPoolExecutor() as executor:
+        for output in executor.map(_run_suite, suites, itertools.repeat(log_level)):
+            print(output, end="")
     
     print("\n" + "="*80)
     print("✅ ALL TEST SUITES COMPLETED")
@@ -606,4 +1069,5 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get('TEST_LOG_LEVEL', 'DEBUG'), format="%(message)s", force=True)
     run_all_tests()
\ No newline at end of file